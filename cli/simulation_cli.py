@@ -5,32 +5,194 @@ Command-line interface for Living Twin Simulation Engine.
 import asyncio
 import json
 import sys
+from collections import Counter
 from pathlib import Path
-from typing import Dict, Any
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 import click
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
 
 # Add src to path for development
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from living_twin_simulation import (
-    SimulationEngine,
-    CommunicationType,
-    OrganizationalMetrics,
-)
+# The simulation engine is imported lazily inside the commands that need it so
+# that `--help`, `example` and `validate` start without loading it.
+if TYPE_CHECKING:
+    from living_twin_simulation import OrganizationalMetrics
 
 console = Console()
 
+REQUIRED_EMPLOYEE_FIELDS = frozenset(("department", "role"))
+
+EmployeeData = Dict[str, Dict[str, str]]
+ColumnSpec = Tuple[Tuple[str, str, bool], ...]
+
+TEST_COMMUNICATION_CONTENT = "This is a test organizational communication for simulation purposes."
+
+# Column definitions for the report tables: (name, style, no_wrap)
+METRICS_COLUMNS: ColumnSpec = (
+    ("Metric", "cyan", True),
+    ("Value", "magenta", False),
+    ("Description", "green", False),
+)
+VALIDATION_COLUMNS: ColumnSpec = (
+    ("Metric", "cyan", False),
+    ("Value", "magenta", False),
+)
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(data: Any) -> bytes:
+    """Serialize to indented JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode()
+
+
+def _json_line(data: Any) -> bytes:
+    """Serialize to a compact, newline-terminated JSON record."""
+    if orjson is not None:
+        return orjson.dumps(data) + b"\n"
+    return json.dumps(data, separators=(",", ":")).encode() + b"\n"
+
+
+EXAMPLE_EMPLOYEES: EmployeeData = {
+    # Executive Leadership
+    "ceo@company.com": {
+        "department": "Executive",
+        "role": "CEO"
+    },
+    "cfo@company.com": {
+        "department": "Finance",
+        "role": "CFO"
+    },
+    "cto@company.com": {
+        "department": "Technology",
+        "role": "CTO"
+    },
+    "chro@company.com": {
+        "department": "Human Resources",
+        "role": "CHRO"
+    },
+    "cmo@company.com": {
+        "department": "Marketing",
+        "role": "CMO"
+    },
+
+    # VP Level - Strategic Decision Makers
+    "vp.engineering@company.com": {
+        "department": "Engineering", 
+        "role": "VP Engineering"
+    },
+    "vp.sales@company.com": {
+        "department": "Sales",
+        "role": "VP Sales"
+    },
+    "vp.product@company.com": {
+        "department": "Product",
+        "role": "VP Product"
+    },
+    "vp.operations@company.com": {
+        "department": "Operations",
+        "role": "VP Operations"
+    },
+
+    # Department Managers - Implementation Leaders
+    "engineering.manager@company.com": {
+        "department": "Engineering",
+        "role": "Engineering Manager"
+    },
+    "sales.manager@company.com": {
+        "department": "Sales",
+        "role": "Sales Manager"
+    },
+    "product.manager@company.com": {
+        "department": "Product",
+        "role": "Product Manager"
+    },
+    "hr.manager@company.com": {
+        "department": "Human Resources",
+        "role": "HR Manager"
+    },
+    "finance.manager@company.com": {
+        "department": "Finance",
+        "role": "Finance Manager"
+    },
+    "marketing.manager@company.com": {
+        "department": "Marketing",
+        "role": "Marketing Manager"
+    },
+    "operations.manager@company.com": {
+        "department": "Operations",
+        "role": "Operations Manager"
+    },
 
-def load_employee_data(file_path: str) -> Dict[str, Any]:
+    # Individual Contributors - Execution Level
+    "john.doe@company.com": {
+        "department": "Engineering",
+        "role": "Senior Engineer"
+    },
+    "jane.smith@company.com": {
+        "department": "Engineering", 
+        "role": "Engineer"
+    },
+    "sales.rep@company.com": {
+        "department": "Sales",
+        "role": "Sales Representative"
+    },
+    "marketing.specialist@company.com": {
+        "department": "Marketing",
+        "role": "Marketing Specialist"
+    },
+    "hr.specialist@company.com": {
+        "department": "Human Resources",
+        "role": "HR Specialist"
+    },
+    "financial.analyst@company.com": {
+        "department": "Finance",
+        "role": "Financial Analyst"
+    },
+    "operations.specialist@company.com": {
+        "department": "Operations",
+        "role": "Operations Specialist"
+    },
+    "product.analyst@company.com": {
+        "department": "Product",
+        "role": "Product Analyst"
+    }
+}
+
+# The example file content never changes, so serialize it once
+EXAMPLE_JSON_BYTES: bytes = json.dumps(EXAMPLE_EMPLOYEES, indent=2).encode()
+
+
+def make_table(title: str, columns: ColumnSpec = METRICS_COLUMNS) -> Table:
+    """Create a fresh table with the given column definitions."""
+    table = Table(title=title)
+    for name, style, no_wrap in columns:
+        table.add_column(name, style=style, no_wrap=no_wrap)
+    return table
+
+
+def load_employee_data(file_path: str) -> EmployeeData:
     """Load employee data from JSON file."""
     try:
-        with open(file_path, 'r') as f:
-            return json.load(f)
+        with open(file_path, 'rb') as f:
+            data: EmployeeData = _json_loads(f.read())
+            return data
     except FileNotFoundError:
         console.print(f"[red]Error: Employee data file not found: {file_path}[/red]")
         sys.exit(1)
@@ -39,13 +201,10 @@ def load_employee_data(file_path: str) -> Dict[str, Any]:
         sys.exit(1)
 
 
-def display_metrics(metrics: OrganizationalMetrics) -> None:
+def display_metrics(metrics: "OrganizationalMetrics") -> None:
     """Display simulation metrics in a formatted table."""
     
-    table = Table(title="Organizational Simulation Metrics")
-    table.add_column("Metric", style="cyan", no_wrap=True)
-    table.add_column("Value", style="magenta")
-    table.add_column("Description", style="green")
+    table = make_table("Organizational Simulation Metrics")
     
     table.add_row("Organization ID", metrics.organization_id, "Target organization")
     table.add_row("Total Communications", str(metrics.total_communications), "Messages sent during simulation")
@@ -60,21 +219,58 @@ def display_metrics(metrics: OrganizationalMetrics) -> None:
     
     console.print(table)
     
-    # Display friction points if any
+    # Collect friction points and bottlenecks so they are written in one print
+    lines: List[str] = []
     if metrics.high_friction_communications:
-        console.print("\n[yellow]High Friction Communications:[/yellow]")
-        for comm_id in metrics.high_friction_communications[:5]:
-            console.print(f"  • {comm_id}")
+        lines.append("\n[yellow]High Friction Communications:[/yellow]")
+        lines.extend(f"  • {comm_id}" for comm_id in metrics.high_friction_communications[:5])
     
     if metrics.bottleneck_agents:
-        console.print("\n[yellow]Bottleneck Agents:[/yellow]")
-        for agent_id in metrics.bottleneck_agents[:5]:
-            console.print(f"  • {agent_id}")
+        lines.append("\n[yellow]Bottleneck Agents:[/yellow]")
+        lines.extend(f"  • {agent_id}" for agent_id in metrics.bottleneck_agents[:5])
+    
+    if lines:
+        console.print("\n".join(lines))
+
+
+def save_results(metrics: "OrganizationalMetrics", output: str, output_format: str = "json") -> None:
+    """Write simulation results to a JSON document or an NDJSON stream."""
+    
+    result_data = {
+        "organization_id": metrics.organization_id,
+        "simulation_id": metrics.simulation_id,
+        "metrics": {
+            "total_communications": metrics.total_communications,
+            "response_rate": metrics.response_rate,
+            "escalation_rate": metrics.escalation_rate,
+            "compliance_rate": metrics.compliance_rate,
+            "collaboration_score": metrics.collaboration_score,
+            "stress_level_average": metrics.stress_level_average,
+        },
+        "duration": {
+            "start_time": metrics.time_period_start.isoformat(),
+            "end_time": metrics.time_period_end.isoformat(),
+            "duration_seconds": (metrics.time_period_end - metrics.time_period_start).total_seconds(),
+        }
+    }
+    
+    # Serialize up front and hand the bytes to a large buffer; json.dump(indent=2)
+    # issues one small write per encoder chunk.
+    with open(output, 'wb', buffering=1 << 20) as f:
+        if output_format == "ndjson":
+            # One summary record, then one record per department, so only a single
+            # line is ever held in memory
+            f.write(_json_line({"type": "summary", **result_data}))
+            for department, stats in metrics.department_metrics.items():
+                f.write(_json_line({"type": "department", "department": department, **stats}))
+        else:
+            result_data["metrics"]["department_metrics"] = metrics.department_metrics
+            f.write(_json_dumps(result_data))
 
 
 @click.group()
 @click.version_option(version="0.1.0")
-def cli():
+def cli() -> None:
     """Living Twin Simulation Engine CLI"""
     pass
 
@@ -86,10 +282,16 @@ def cli():
 @click.option('--duration', default=30, help='Simulation duration in simulated days')
 @click.option('--acceleration', default=144, help='Time acceleration factor (144 = 10s = 1 day)')
 @click.option('--output', help='Output file for simulation results (JSON)')
+@click.option('--format', 'output_format', type=click.Choice(['json', 'ndjson']), default='json',
+              help='Output file format (ndjson streams one record per line)')
 @click.option('--verbose', '-v', is_flag=True, help='Verbose logging')
-def run(org_id: str, employees: str, duration: int, acceleration: int, output: str, verbose: bool):
+def run(org_id: str, employees: str, duration: int, acceleration: int, output: Optional[str],
+        output_format: str, verbose: bool) -> None:
     """Run a complete organizational behavior simulation."""
     
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+    from living_twin_simulation import SimulationEngine, CommunicationType
+    
     if verbose:
         import logging
         logging.basicConfig(level=logging.INFO)
@@ -103,7 +305,7 @@ def run(org_id: str, employees: str, duration: int, acceleration: int, output: s
     employee_data = load_employee_data(employees)
     console.print(f"[green]Loaded {len(employee_data)} employees[/green]")
     
-    async def run_simulation():
+    async def run_simulation() -> "OrganizationalMetrics":
         # Create and configure simulation
         engine = SimulationEngine(org_id, acceleration)
         
@@ -111,42 +313,45 @@ def run(org_id: str, employees: str, duration: int, acceleration: int, output: s
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
             console=console,
+            refresh_per_second=4,
         ) as progress:
             
             # Start simulation
             task = progress.add_task("Starting simulation...", total=None)
             await engine.start_simulation(employee_data)
-            progress.update(task, description="Simulation started")
             
             # Run for specified duration
             progress.update(task, description=f"Running simulation for {duration} days...")
             
             # Simulate some communications
-            agent_ids = list(engine.state.agents.keys())
+            agent_ids = tuple(engine.state.agents)
             if len(agent_ids) >= 2:
-                # Send some test communications
-                for i in range(min(5, len(agent_ids) // 2)):
-                    sender = agent_ids[i]
-                    recipients = agent_ids[i+1:i+3]  # Send to 1-2 recipients
-                    
-                    await engine.send_communication(
-                        sender_id=sender,
+                # Send some test communications to 1-2 recipients each
+                recipient_slices = [
+                    list(agent_ids[i+1:i+3]) for i in range(min(5, len(agent_ids) // 2))
+                ]
+                subjects = [f"Test Communication {i+1}" for i in range(len(recipient_slices))]
+                await asyncio.gather(*(
+                    engine.send_communication(
+                        sender_id=agent_ids[i],
                         recipient_ids=recipients,
                         communication_type=CommunicationType.NUDGE,
-                        subject=f"Test Communication {i+1}",
-                        content=f"This is a test organizational communication for simulation purposes.",
+                        subject=subject,
+                        content=TEST_COMMUNICATION_CONTENT,
                         priority_level=3
                     )
+                    for i, (recipients, subject) in enumerate(zip(recipient_slices, subjects))
+                ))
             
             # Wait for simulation to process
-            await asyncio.sleep(5)  # Let simulation run for a bit
+            await engine.wait_for_pending_communications(timeout=5)
             
             # Stop simulation
             progress.update(task, description="Stopping simulation...")
             await engine.stop_simulation()
             
-            # Calculate final metrics
-            progress.update(task, description="Calculating metrics...")
+            # Calculate final metrics; this is synchronous, so a status update
+            # here would never be drawn before the next one
             metrics = engine.calculate_organizational_metrics()
             
             progress.update(task, description="Complete!", completed=True)
@@ -163,28 +368,7 @@ def run(org_id: str, employees: str, duration: int, acceleration: int, output: s
         
         # Save results if output file specified
         if output:
-            result_data = {
-                "organization_id": metrics.organization_id,
-                "simulation_id": metrics.simulation_id,
-                "metrics": {
-                    "total_communications": metrics.total_communications,
-                    "response_rate": metrics.response_rate,
-                    "escalation_rate": metrics.escalation_rate,
-                    "compliance_rate": metrics.compliance_rate,
-                    "collaboration_score": metrics.collaboration_score,
-                    "stress_level_average": metrics.stress_level_average,
-                    "department_metrics": metrics.department_metrics,
-                },
-                "duration": {
-                    "start_time": metrics.time_period_start.isoformat(),
-                    "end_time": metrics.time_period_end.isoformat(),
-                    "duration_seconds": (metrics.time_period_end - metrics.time_period_start).total_seconds(),
-                }
-            }
-            
-            with open(output, 'w') as f:
-                json.dump(result_data, f, indent=2)
-            
+            save_results(metrics, output, output_format)
             console.print(f"[green]Results saved to {output}[/green]")
         
     except KeyboardInterrupt:
@@ -197,7 +381,7 @@ def run(org_id: str, employees: str, duration: int, acceleration: int, output: s
 
 @cli.command()
 @click.argument('employee_file', type=click.Path(exists=True))
-def validate(employee_file: str):
+def validate(employee_file: str) -> None:
     """Validate employee data format."""
     
     console.print(f"[blue]Validating employee data: {employee_file}[/blue]")
@@ -206,26 +390,23 @@ def validate(employee_file: str):
         employee_data = load_employee_data(employee_file)
         
         # Validate structure
-        required_fields = ['department', 'role']
         valid_count = 0
-        warnings = []
+        warnings: List[str] = []
         
         for email, data in employee_data.items():
             if not isinstance(data, dict):
                 warnings.append(f"Invalid data for {email}: expected object, got {type(data).__name__}")
                 continue
             
-            missing_fields = [field for field in required_fields if field not in data]
+            missing_fields = REQUIRED_EMPLOYEE_FIELDS - data.keys()
             if missing_fields:
-                warnings.append(f"Missing fields for {email}: {missing_fields}")
+                warnings.append(f"Missing fields for {email}: {sorted(missing_fields)}")
                 continue
             
             valid_count += 1
         
         # Display results
-        table = Table(title="Employee Data Validation")
-        table.add_column("Metric", style="cyan")
-        table.add_column("Value", style="magenta")
+        table = make_table("Employee Data Validation", VALIDATION_COLUMNS)
         
         table.add_row("Total Employees", str(len(employee_data)))
         table.add_row("Valid Employees", str(valid_count))
@@ -252,126 +433,18 @@ def validate(employee_file: str):
 
 
 @cli.command()
-def example():
+def example() -> None:
     """Generate example employee data file."""
     
-    example_data = {
-        # Executive Leadership
-        "ceo@company.com": {
-            "department": "Executive",
-            "role": "CEO"
-        },
-        "cfo@company.com": {
-            "department": "Finance",
-            "role": "CFO"
-        },
-        "cto@company.com": {
-            "department": "Technology",
-            "role": "CTO"
-        },
-        "chro@company.com": {
-            "department": "Human Resources",
-            "role": "CHRO"
-        },
-        "cmo@company.com": {
-            "department": "Marketing",
-            "role": "CMO"
-        },
-        
-        # VP Level - Strategic Decision Makers
-        "vp.engineering@company.com": {
-            "department": "Engineering", 
-            "role": "VP Engineering"
-        },
-        "vp.sales@company.com": {
-            "department": "Sales",
-            "role": "VP Sales"
-        },
-        "vp.product@company.com": {
-            "department": "Product",
-            "role": "VP Product"
-        },
-        "vp.operations@company.com": {
-            "department": "Operations",
-            "role": "VP Operations"
-        },
-        
-        # Department Managers - Implementation Leaders
-        "engineering.manager@company.com": {
-            "department": "Engineering",
-            "role": "Engineering Manager"
-        },
-        "sales.manager@company.com": {
-            "department": "Sales",
-            "role": "Sales Manager"
-        },
-        "product.manager@company.com": {
-            "department": "Product",
-            "role": "Product Manager"
-        },
-        "hr.manager@company.com": {
-            "department": "Human Resources",
-            "role": "HR Manager"
-        },
-        "finance.manager@company.com": {
-            "department": "Finance",
-            "role": "Finance Manager"
-        },
-        "marketing.manager@company.com": {
-            "department": "Marketing",
-            "role": "Marketing Manager"
-        },
-        "operations.manager@company.com": {
-            "department": "Operations",
-            "role": "Operations Manager"
-        },
-        
-        # Individual Contributors - Execution Level
-        "john.doe@company.com": {
-            "department": "Engineering",
-            "role": "Senior Engineer"
-        },
-        "jane.smith@company.com": {
-            "department": "Engineering", 
-            "role": "Engineer"
-        },
-        "sales.rep@company.com": {
-            "department": "Sales",
-            "role": "Sales Representative"
-        },
-        "marketing.specialist@company.com": {
-            "department": "Marketing",
-            "role": "Marketing Specialist"
-        },
-        "hr.specialist@company.com": {
-            "department": "Human Resources",
-            "role": "HR Specialist"
-        },
-        "financial.analyst@company.com": {
-            "department": "Finance",
-            "role": "Financial Analyst"
-        },
-        "operations.specialist@company.com": {
-            "department": "Operations",
-            "role": "Operations Specialist"
-        },
-        "product.analyst@company.com": {
-            "department": "Product",
-            "role": "Product Analyst"
-        }
-    }
-    
     output_file = "example_employees.json"
-    with open(output_file, 'w') as f:
-        json.dump(example_data, f, indent=2)
+    Path(output_file).write_bytes(EXAMPLE_JSON_BYTES)
     
     console.print(f"[green]Enhanced example employee data created: {output_file}[/green]")
-    console.print(f"[blue]Total employees: {len(example_data)}[/blue]")
+    console.print(f"[blue]Total employees: {len(EXAMPLE_EMPLOYEES)}[/blue]")
     console.print("\n[blue]Departments included:[/blue]")
-    departments = set(emp["department"] for emp in example_data.values())
-    for dept in sorted(departments):
-        count = sum(1 for emp in example_data.values() if emp["department"] == dept)
-        console.print(f"  • {dept}: {count} employees")
+    department_counts = Counter(emp["department"] for emp in EXAMPLE_EMPLOYEES.values())
+    for dept in sorted(department_counts):
+        console.print(f"  • {dept}: {department_counts[dept]} employees")
     
     console.print("\n[blue]Usage:[/blue]")
     console.print(f"uv run python cli/simulation_cli.py run --org-id acme_corp --employees {output_file}")
@@ -382,8 +455,13 @@ def example():
     console.print("  • Innovation vs. Stability (Technology + Engineering)")
 
 
-def main():
+def main() -> None:
     """Main CLI entry point."""
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
     cli()
 
 
@@ -7,7 +7,8 @@ import asyncio
 import json
 import sys
 from pathlib import Path
-from typing import Dict, List
+from types import MappingProxyType
+from typing import Dict, List, Tuple
 
 # Add src to path for development
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
@@ -18,6 +19,38 @@ from living_twin_simulation import (
     OrganizationalMetrics,
 )
 
+# Canonical executive roster; each test selects its participants by email.
+# Selection order matters: agent ids follow it, and tests index into them.
+ALL_EXECS = MappingProxyType({
+    "ceo@company.com": {"department": "Executive", "role": "CEO"},
+    "cfo@company.com": {"department": "Finance", "role": "CFO"},
+    "cmo@company.com": {"department": "Marketing", "role": "CMO"},
+    "cto@company.com": {"department": "Technology", "role": "CTO"},
+    "vp.sales@company.com": {"department": "Sales", "role": "VP Sales"},
+    "vp.engineering@company.com": {"department": "Engineering", "role": "VP Engineering"},
+    "vp.product@company.com": {"department": "Product", "role": "VP Product"},
+})
+
+TRADITIONAL_KEYS = ("ceo@company.com", "cfo@company.com", "vp.sales@company.com", "vp.engineering@company.com")
+CATCHBALL_KEYS = (
+    "ceo@company.com", "cmo@company.com", "vp.sales@company.com",
+    "vp.product@company.com", "cto@company.com", "cfo@company.com",
+)
+WISDOM_KEYS = (
+    "ceo@company.com", "cto@company.com", "vp.engineering@company.com",
+    "cfo@company.com", "vp.product@company.com",
+)
+CONFLICT_KEYS = (
+    "ceo@company.com", "cfo@company.com", "vp.sales@company.com",
+    "vp.engineering@company.com", "vp.product@company.com",
+)
+
+
+def select_execs(keys: Tuple[str, ...]) -> Dict[str, Dict[str, str]]:
+    """Build employee data for the given executives, preserving order."""
+    return {email: ALL_EXECS[email] for email in keys}
+
+
 async def test_traditional_communication():
     """Test traditional one-way communication patterns."""
     print("\n" + "="*60)
@@ -27,57 +60,42 @@ async def test_traditional_communication():
     # Setup simulation
     engine = SimulationEngine("traditional_test")
     
-    employee_data = {
-        "ceo@company.com": {"department": "Executive", "role": "CEO"},
-        "cfo@company.com": {"department": "Finance", "role": "CFO"},
-        "vp.sales@company.com": {"department": "Sales", "role": "VP Sales"},
-        "vp.engineering@company.com": {"department": "Engineering", "role": "VP Engineering"},
-    }
+    employee_data = select_execs(TRADITIONAL_KEYS)
     
     await engine.start_simulation(employee_data)
     agent_ids = list(engine.state.agents.keys())
     
-    # Test 1: NUDGE with potential escalation
+    # The three patterns are independent, so dispatch them as one batch
     print("\n1. Testing NUDGE → Response → Escalation")
+    print("2. Testing RECOMMENDATION → Departmental Interpretation")
+    print("3. Testing DIRECT_ORDER → Compliance Tracking")
     print("-" * 40)
     
-    await engine.send_communication(
-        sender_id=agent_ids[0],  # CEO
-        recipient_ids=agent_ids[1:],  # All VPs
-        communication_type=CommunicationType.NUDGE,
-        subject="Q4 Growth Targets",
-        content="We're targeting 15% organic growth this quarter. How is your department positioned to contribute to this goal?"
+    await asyncio.gather(
+        engine.send_communication(
+            sender_id=agent_ids[0],  # CEO
+            recipient_ids=agent_ids[1:],  # All VPs
+            communication_type=CommunicationType.NUDGE,
+            subject="Q4 Growth Targets",
+            content="We're targeting 15% organic growth this quarter. How is your department positioned to contribute to this goal?"
+        ),
+        engine.send_communication(
+            sender_id=agent_ids[0],  # CEO
+            recipient_ids=agent_ids[1:],  # All VPs
+            communication_type=CommunicationType.RECOMMENDATION,
+            subject="Strategic Priority: Customer Retention",
+            content="Customer churn is at 8%. I recommend making customer retention a top priority across all customer-facing teams."
+        ),
+        engine.send_communication(
+            sender_id=agent_ids[0],  # CEO
+            recipient_ids=agent_ids[1:],  # All VPs
+            communication_type=CommunicationType.DIRECT_ORDER,
+            subject="Employee Satisfaction: Immediate Action Required",
+            content="Employee satisfaction scores must improve by 20% within 90 days. This is critical for retention and hiring."
+        ),
     )
     
-    await asyncio.sleep(5)
-    
-    # Test 2: RECOMMENDATION with departmental interpretation
-    print("\n2. Testing RECOMMENDATION → Departmental Interpretation")
-    print("-" * 40)
-    
-    await engine.send_communication(
-        sender_id=agent_ids[0],  # CEO
-        recipient_ids=agent_ids[1:],  # All VPs
-        communication_type=CommunicationType.RECOMMENDATION,
-        subject="Strategic Priority: Customer Retention",
-        content="Customer churn is at 8%. I recommend making customer retention a top priority across all customer-facing teams."
-    )
-    
-    await asyncio.sleep(5)
-    
-    # Test 3: DIRECT_ORDER with compliance tracking
-    print("\n3. Testing DIRECT_ORDER → Compliance Tracking")
-    print("-" * 40)
-    
-    await engine.send_communication(
-        sender_id=agent_ids[0],  # CEO
-        recipient_ids=agent_ids[1:],  # All VPs
-        communication_type=CommunicationType.DIRECT_ORDER,
-        subject="Employee Satisfaction: Immediate Action Required",
-        content="Employee satisfaction scores must improve by 20% within 90 days. This is critical for retention and hiring."
-    )
-    
-    await asyncio.sleep(5)
+    await engine.wait_for_pending_communications(timeout=5)
     
     # Get metrics
     metrics = engine.calculate_organizational_metrics()
@@ -98,14 +116,7 @@ async def test_catchball_communication():
     # Setup simulation
     engine = SimulationEngine("catchball_test")
     
-    employee_data = {
-        "ceo@company.com": {"department": "Executive", "role": "CEO"},
-        "cmo@company.com": {"department": "Marketing", "role": "CMO"},
-        "vp.sales@company.com": {"department": "Sales", "role": "VP Sales"},
-        "vp.product@company.com": {"department": "Product", "role": "VP Product"},
-        "cto@company.com": {"department": "Technology", "role": "CTO"},
-        "cfo@company.com": {"department": "Finance", "role": "CFO"},
-    }
+    employee_data = select_execs(CATCHBALL_KEYS)
     
     await engine.start_simulation(employee_data)
     agent_ids = list(engine.state.agents.keys())
@@ -126,7 +137,8 @@ async def test_catchball_communication():
         content="We're entering the European market in Q1. This is a strategic priority for our growth objectives."
     )
     
-    await asyncio.sleep(5)
+    # Each round builds on the responses to the previous one
+    await engine.wait_for_pending_communications(timeout=5)
     
     # Round 2: Refined strategy based on feedback
     print("\nRound 2: Refined Strategy")
@@ -140,7 +152,7 @@ async def test_catchball_communication():
         content="Based on your feedback, let's phase the expansion: Q1 for preparation and partnerships, Q2 for market launch."
     )
     
-    await asyncio.sleep(5)
+    await engine.wait_for_pending_communications(timeout=5)
     
     # Round 3: Final alignment
     print("\nRound 3: Final Alignment")
@@ -154,7 +166,7 @@ async def test_catchball_communication():
         content="Confirmed: Q1 preparation phase, Q2 European market launch. All departments aligned and committed."
     )
     
-    await asyncio.sleep(5)
+    await engine.wait_for_pending_communications(timeout=5)
     
     # Get metrics
     metrics = engine.calculate_organizational_metrics()
@@ -175,13 +187,7 @@ async def test_wisdom_of_the_crowd():
     # Setup simulation
     engine = SimulationEngine("wisdom_test")
     
-    employee_data = {
-        "ceo@company.com": {"department": "Executive", "role": "CEO"},
-        "cto@company.com": {"department": "Technology", "role": "CTO"},
-        "vp.engineering@company.com": {"department": "Engineering", "role": "VP Engineering"},
-        "cfo@company.com": {"department": "Finance", "role": "CFO"},
-        "vp.product@company.com": {"department": "Product", "role": "VP Product"},
-    }
+    employee_data = select_execs(WISDOM_KEYS)
     
     await engine.start_simulation(employee_data)
     agent_ids = list(engine.state.agents.keys())
@@ -198,7 +204,7 @@ async def test_wisdom_of_the_crowd():
         content="We need to invest 20% of our budget in emerging technologies. This could give us competitive advantage but may impact our current stability."
     )
     
-    await asyncio.sleep(5)
+    await engine.wait_for_pending_communications(timeout=5)
     
     # Get wisdom insights (if available)
     try:
@@ -230,13 +236,7 @@ async def test_priority_conflicts():
     # Setup simulation
     engine = SimulationEngine("conflict_test")
     
-    employee_data = {
-        "ceo@company.com": {"department": "Executive", "role": "CEO"},
-        "cfo@company.com": {"department": "Finance", "role": "CFO"},
-        "vp.sales@company.com": {"department": "Sales", "role": "VP Sales"},
-        "vp.engineering@company.com": {"department": "Engineering", "role": "VP Engineering"},
-        "vp.product@company.com": {"department": "Product", "role": "VP Product"},
-    }
+    employee_data = select_execs(CONFLICT_KEYS)
     
     await engine.start_simulation(employee_data)
     agent_ids = list(engine.state.agents.keys())
@@ -245,27 +245,26 @@ async def test_priority_conflicts():
     print("\nTesting Competing Strategic Priorities")
     print("-" * 60)
     
-    # Priority A: Growth
-    await engine.send_communication(
-        sender_id=agent_ids[0],  # CEO
-        recipient_ids=agent_ids[1:],  # All VPs
-        communication_type=CommunicationType.RECOMMENDATION,
-        subject="Q4 Growth Priority",
-        content="We need to achieve 15% growth this quarter to meet investor expectations."
-    )
-    
-    await asyncio.sleep(3)
-    
-    # Priority B: Profitability
-    await engine.send_communication(
-        sender_id=agent_ids[0],  # CEO
-        recipient_ids=agent_ids[1:],  # All VPs
-        communication_type=CommunicationType.RECOMMENDATION,
-        subject="Profitability Priority",
-        content="We must maintain 15% profit margins to ensure financial stability."
+    # Priority A (growth) and Priority B (profitability) compete independently
+    await asyncio.gather(
+        engine.send_communication(
+            sender_id=agent_ids[0],  # CEO
+            recipient_ids=agent_ids[1:],  # All VPs
+            communication_type=CommunicationType.RECOMMENDATION,
+            subject="Q4 Growth Priority",
+            content="We need to achieve 15% growth this quarter to meet investor expectations."
+        ),
+        engine.send_communication(
+            sender_id=agent_ids[0],  # CEO
+            recipient_ids=agent_ids[1:],  # All VPs
+            communication_type=CommunicationType.RECOMMENDATION,
+            subject="Profitability Priority",
+            content="We must maintain 15% profit margins to ensure financial stability."
+        ),
     )
     
-    await asyncio.sleep(5)
+    # Let the conflicting directives land before trying to resolve them
+    await engine.wait_for_pending_communications(timeout=5)
     
     # Resolution attempt
     await engine.send_communication(
@@ -276,7 +275,7 @@ async def test_priority_conflicts():
         content="We will target 10% growth while maintaining 15% margins. This requires efficiency improvements and selective growth investments."
     )
     
-    await asyncio.sleep(5)
+    await engine.wait_for_pending_communications(timeout=5)
     
     # Get metrics
     metrics = engine.calculate_organizational_metrics()
@@ -322,4 +321,9 @@ async def main():
 
 
 if __name__ == "__main__":
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
     asyncio.run(main())
@@ -42,35 +42,39 @@ Example Usage:
     metrics = engine.calculate_organizational_metrics()
 """
 
-from .domain.models import (
-    OrganizationalMember,
-    StrategicCommunication,
-    AgentResponse,
-    ConsultationRequest,
-    ConsultationFeedback,
-    SimulationState,
-    SimulationEvent,
-    OrganizationalMetrics,
-    PersonalityProfile,
-    ProfessionalProfile,
-    OrganizationalMemberMemory,
-    PersonalityTrait,
-    CommunicationType,
-    ResponseType,
-    OrganizationalMemberState,
-    IntelligenceAgentType,
-    StrategicPriority,
-    TruthAgent,
-    GossipAgent,
-    MarketIntelligenceAgent,
-    CatchballAgent,
-    WisdomAgent,
-    OrganizationalTwin,
-)
+import importlib
+from typing import Any, Dict, List
 
-from .simulation.simulation_engine import SimulationEngine
-from .agents.agent_factory import AgentFactory
-from .agents.behavior_engine import BehaviorEngine
+# Public names are resolved lazily (PEP 562) so that importing the package does
+# not pull in the simulation engine and its dependencies until they are used.
+_LAZY_IMPORTS: Dict[str, str] = {
+    "OrganizationalMember": ".domain.models",
+    "StrategicCommunication": ".domain.models",
+    "AgentResponse": ".domain.models",
+    "ConsultationRequest": ".domain.models",
+    "ConsultationFeedback": ".domain.models",
+    "SimulationState": ".domain.models",
+    "SimulationEvent": ".domain.models",
+    "OrganizationalMetrics": ".domain.models",
+    "PersonalityProfile": ".domain.models",
+    "ProfessionalProfile": ".domain.models",
+    "OrganizationalMemberMemory": ".domain.models",
+    "PersonalityTrait": ".domain.models",
+    "CommunicationType": ".domain.models",
+    "ResponseType": ".domain.models",
+    "OrganizationalMemberState": ".domain.models",
+    "IntelligenceAgentType": ".domain.models",
+    "StrategicPriority": ".domain.models",
+    "TruthAgent": ".domain.models",
+    "GossipAgent": ".domain.models",
+    "MarketIntelligenceAgent": ".domain.models",
+    "CatchballAgent": ".domain.models",
+    "WisdomAgent": ".domain.models",
+    "OrganizationalTwin": ".domain.models",
+    "SimulationEngine": ".simulation.simulation_engine",
+    "AgentFactory": ".agents.agent_factory",
+    "BehaviorEngine": ".agents.behavior_engine",
+}
 
 __version__ = "0.1.0"
 __author__ = "Living Twin Team"
@@ -114,3 +118,17 @@ __all__ = [
     "AgentFactory",
     "BehaviorEngine",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    # Cache on the module so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -3,7 +3,14 @@ Agent factory for creating AI agents from employee data.
 """
 
 import random
-from typing import Dict, List, Optional
+import re
+from array import array
+from bisect import bisect_left
+from functools import lru_cache
+from itertools import accumulate, chain
+from types import MappingProxyType
+from uuid import uuid4
+from typing import Dict, Iterable, List, Optional, Tuple
 from datetime import datetime
 
 from ..domain.models import (
@@ -13,8 +20,73 @@ from ..domain.models import (
     AgentMemory,
     PersonalityTrait,
     AgentState,
+    RelationshipScores,
 )
 
+# Trait order used for the flat archetype rows below
+TRAIT_ORDER = tuple(PersonalityTrait)
+
+# Initial agent state distribution, as parallel states / cumulative probabilities
+INITIAL_STATE_DISTRIBUTION = (
+    (AgentState.AVAILABLE, 0.6),
+    (AgentState.BUSY, 0.3),
+    (AgentState.IN_MEETING, 0.08),
+    (AgentState.OVERWHELMED, 0.02),
+)
+INITIAL_STATES = tuple(state for state, _ in INITIAL_STATE_DISTRIBUTION)
+INITIAL_STATE_CUMULATIVE = tuple(accumulate(probability for _, probability in INITIAL_STATE_DISTRIBUTION))
+
+# Role title fragments per seniority level, checked from most to least senior
+SENIORITY_PATTERNS = (
+    (5, re.compile("ceo|chief|president", re.IGNORECASE)),
+    (4, re.compile("vp|vice president", re.IGNORECASE)),
+    (3, re.compile("director|head of", re.IGNORECASE)),
+    (2, re.compile("manager|lead", re.IGNORECASE)),
+)
+
+
+def _workload_capacity(seniority_level: int) -> float:
+    """Workload capacity multiplier for a seniority level."""
+    # Higher seniority = higher capacity (more resources, delegation ability)
+    base_capacity = 0.8 + (seniority_level * 0.1)
+    return min(1.5, base_capacity)  # Cap at 1.5x normal capacity
+
+
+# Seniority levels are 1-5, so capacities are looked up rather than recomputed
+WORKLOAD_CAPACITY_BY_SENIORITY = tuple(_workload_capacity(level) for level in range(6))
+
+
+@lru_cache(maxsize=4096)
+def _name_from_email(email: str) -> str:
+    """Derive a display name from an email address."""
+    if not email:
+        return "Unknown"
+    
+    local_part = email.split("@")[0]
+    # Convert john.doe or john_doe to John Doe
+    name_parts = local_part.replace(".", " ").replace("_", " ").split()
+    return " ".join(part.capitalize() for part in name_parts)
+
+
+@lru_cache(maxsize=1024)
+def _expertise_role_flags(role: str) -> Tuple[bool, bool, bool]:
+    """Classify a role as (senior, manager, executive) for expertise purposes."""
+    role_lower = role.lower()
+    return (
+        "senior" in role_lower or "lead" in role_lower,
+        "manager" in role_lower or "director" in role_lower,
+        any(title in role_lower for title in ("vp", "chief", "ceo")),
+    )
+
+
+@lru_cache(maxsize=1024)
+def _seniority_for_role(role: str) -> int:
+    """Map a role title to a seniority level; roles repeat heavily across an org."""
+    for level, pattern in SENIORITY_PATTERNS:
+        if pattern.search(role):
+            return level
+    return 1
+
 
 class AgentFactory:
     """Factory for creating simulation agents from employee data."""
@@ -94,17 +166,34 @@ class AgentFactory:
             PersonalityTrait.COLLABORATION_PREFERENCE: 0.8,
         },
     }
+    # Archetypes are shared by every agent that resolves to them, so freeze them
+    PERSONALITY_ARCHETYPES = MappingProxyType({
+        archetype: MappingProxyType(traits) for archetype, traits in PERSONALITY_ARCHETYPES.items()
+    })
     
-    # Department-specific expertise areas
-    DEPARTMENT_EXPERTISE = {
-        "Engineering": ["software_development", "system_architecture", "technical_design", "code_review"],
-        "Sales": ["customer_relations", "negotiation", "market_analysis", "revenue_optimization"],
-        "Marketing": ["brand_management", "content_creation", "market_research", "campaign_management"],
-        "HR": ["talent_acquisition", "employee_relations", "policy_development", "performance_management"],
-        "Operations": ["process_optimization", "resource_management", "quality_assurance", "logistics"],
-        "IT": ["infrastructure", "security", "data_management", "technical_support"],
-        "Finance": ["financial_analysis", "budgeting", "risk_assessment", "compliance"],
-    }
+    # Lowercased archetype names with one trait value per TRAIT_ORDER entry,
+    # in priority order
+    _ARCHETYPES_LOWER = tuple(
+        (archetype.lower(), tuple(traits[trait] for trait in TRAIT_ORDER))
+        for archetype, traits in PERSONALITY_ARCHETYPES.items()
+    )
+    _BALANCED_TRAITS = (0.5,) * len(TRAIT_ORDER)
+    
+    # Department-specific expertise areas (read-only; resolved tuples are shared)
+    DEPARTMENT_EXPERTISE = MappingProxyType({
+        "Engineering": ("software_development", "system_architecture", "technical_design", "code_review"),
+        "Sales": ("customer_relations", "negotiation", "market_analysis", "revenue_optimization"),
+        "Marketing": ("brand_management", "content_creation", "market_research", "campaign_management"),
+        "HR": ("talent_acquisition", "employee_relations", "policy_development", "performance_management"),
+        "Operations": ("process_optimization", "resource_management", "quality_assurance", "logistics"),
+        "IT": ("infrastructure", "security", "data_management", "technical_support"),
+        "Finance": ("financial_analysis", "budgeting", "risk_assessment", "compliance"),
+    })
+    
+    # Role title fragments used to infer reporting lines
+    MANAGER_ROLE_PATTERN = re.compile("manager|director|vp|head", re.IGNORECASE)
+    DIRECT_REPORT_ROLE_PATTERN = re.compile("manager|director|vp|ceo|head", re.IGNORECASE)
+    NON_REPORT_ROLE_PATTERN = re.compile("manager|director|vp|ceo", re.IGNORECASE)
     
     @classmethod
     def create_agent_from_employee(
@@ -112,7 +201,8 @@ class AgentFactory:
         employee_data: Dict,
         organization_id: str,
         manager_id: Optional[str] = None,
-        direct_reports: Optional[List[str]] = None
+        direct_reports: Optional[List[str]] = None,
+        agent_id: Optional[str] = None
     ) -> SimulationAgent:
         """Create a simulation agent from employee data."""
         
@@ -150,6 +240,7 @@ class AgentFactory:
         initial_state = cls._determine_initial_state()
         
         return SimulationAgent(
+            id=agent_id or str(uuid4()),
             email=email,
             name=name,
             personality=personality,
@@ -167,213 +258,232 @@ class AgentFactory:
     ) -> Dict[str, SimulationAgent]:
         """Create all agents for an organization from employee data."""
         
-        agents = {}
         employee_data = organization_data.get("employees", {})
         
+        # Ids and reporting lines are known before any agent exists, so each agent
+        # is created with its manager and direct reports already set
+        email_to_agent_id = {email: str(uuid4()) for email in employee_data}
+        manager_of, reports_of = cls._build_reporting_maps(employee_data)
+        
         # First pass: create all agents
+        agents = {}
         for email, employee_info in employee_data.items():
+            manager_email = manager_of[email]
             agent = cls.create_agent_from_employee(
                 {**employee_info, "email": email},
-                organization_id
+                organization_id,
+                manager_id=email_to_agent_id[manager_email] if manager_email else None,
+                direct_reports=[email_to_agent_id[report_email] for report_email in reports_of.get(email, ())],
+                agent_id=email_to_agent_id[email],
             )
             agents[agent.id] = agent
+        cls._assign_department_ids(agents.values())
         
-        # Second pass: establish reporting relationships
-        email_to_agent_id = {agent.email: agent.id for agent in agents.values()}
-        
+        # Second pass: initialize relationship scores with colleagues
+        colleague_groups = cls._colleague_groups(agents)
+        relationship_index = cls._relationship_index(colleague_groups)
         for agent in agents.values():
-            # Find manager
-            manager_email = cls._find_manager_email(agent.email, employee_data)
-            if manager_email and manager_email in email_to_agent_id:
-                agent.professional.manager_id = email_to_agent_id[manager_email]
-            
-            # Find direct reports
-            direct_report_emails = cls._find_direct_reports(agent.email, employee_data)
-            agent.professional.direct_reports = [
-                email_to_agent_id[email] for email in direct_report_emails
-                if email in email_to_agent_id
-            ]
-            
-            # Initialize relationship scores with colleagues
-            cls._initialize_relationship_scores(agent, agents)
+            cls._initialize_relationship_scores(agent, agents, colleague_groups, relationship_index)
         
         return agents
     
     @classmethod
     def _extract_name_from_email(cls, email: str) -> str:
         """Extract a display name from email address."""
-        if not email:
-            return "Unknown"
-        
-        local_part = email.split("@")[0]
-        # Convert john.doe or john_doe to John Doe
-        name_parts = local_part.replace(".", " ").replace("_", " ").split()
-        return " ".join(part.capitalize() for part in name_parts)
+        return _name_from_email(email)
     
     @classmethod
     def _determine_seniority_level(cls, role: str) -> int:
         """Determine seniority level from role title."""
-        role_lower = role.lower()
-        
-        if any(title in role_lower for title in ["ceo", "chief", "president"]):
-            return 5
-        elif any(title in role_lower for title in ["vp", "vice president"]):
-            return 4
-        elif any(title in role_lower for title in ["director", "head of"]):
-            return 3
-        elif any(title in role_lower for title in ["manager", "lead", "senior manager"]):
-            return 2
-        else:
-            return 1
+        return _seniority_for_role(role)
     
     @classmethod
     def _create_personality_profile(cls, role: str, department: str) -> PersonalityProfile:
         """Create a personality profile based on role and department."""
         
+        base_traits = cls._resolve_archetype(role, department)
+        
+        # Add some individual variation (uniform in ±0.2)
+        rand = random.random
+        varied_values = [max(0.0, min(1.0, base_value + (-0.2 + 0.4 * rand()))) for base_value in base_traits]
+        
+        return PersonalityProfile.from_values(varied_values)
+    
+    @classmethod
+    @lru_cache(maxsize=512)
+    def _resolve_archetype(cls, role: str, department: str) -> Tuple[float, ...]:
+        """Resolve base trait values, in TRAIT_ORDER, for a role and department."""
         # Start with role-based archetype
-        base_traits = {}
-        for archetype, traits in cls.PERSONALITY_ARCHETYPES.items():
-            if archetype.lower() in role.lower():
-                base_traits = traits.copy()
-                break
+        role_lower = role.lower()
+        for archetype, traits in cls._ARCHETYPES_LOWER:
+            if archetype in role_lower:
+                return traits
         
         # If no role match, use department-based traits
-        if not base_traits:
-            for archetype, traits in cls.PERSONALITY_ARCHETYPES.items():
-                if archetype.lower() in department.lower():
-                    base_traits = traits.copy()
-                    break
+        department_lower = department.lower()
+        for archetype, traits in cls._ARCHETYPES_LOWER:
+            if archetype in department_lower:
+                return traits
         
         # Default to balanced traits if no match
-        if not base_traits:
-            base_traits = {trait: 0.5 for trait in PersonalityTrait}
-        
-        # Add some individual variation (±0.2)
-        varied_traits = {}
-        for trait, base_value in base_traits.items():
-            variation = random.uniform(-0.2, 0.2)
-            varied_traits[trait] = max(0.0, min(1.0, base_value + variation))
-        
-        return PersonalityProfile(traits=varied_traits)
+        return cls._BALANCED_TRAITS
     
     @classmethod
-    def _get_expertise_areas(cls, department: str, role: str) -> List[str]:
+    def _get_expertise_areas(cls, department: str, role: str) -> Tuple[str, ...]:
         """Get expertise areas based on department and role."""
-        base_expertise = cls.DEPARTMENT_EXPERTISE.get(department, ["general_business"])
+        return cls._expertise_for(department, *_expertise_role_flags(role))
+    
+    @classmethod
+    @lru_cache(maxsize=256)
+    def _expertise_for(
+        cls,
+        department: str,
+        is_senior: bool,
+        is_manager: bool,
+        is_executive: bool
+    ) -> Tuple[str, ...]:
+        """Build the shared, immutable expertise tuple for a department and role profile."""
+        expertise = list(cls.DEPARTMENT_EXPERTISE.get(department, ("general_business",)))
         
         # Add role-specific expertise
-        role_lower = role.lower()
-        if "senior" in role_lower or "lead" in role_lower:
-            base_expertise.append("mentoring")
-        if "manager" in role_lower or "director" in role_lower:
-            base_expertise.extend(["team_management", "strategic_planning"])
-        if any(title in role_lower for title in ["vp", "chief", "ceo"]):
-            base_expertise.extend(["executive_leadership", "organizational_strategy"])
+        if is_senior:
+            expertise.append("mentoring")
+        if is_manager:
+            expertise.extend(["team_management", "strategic_planning"])
+        if is_executive:
+            expertise.extend(["executive_leadership", "organizational_strategy"])
         
-        return base_expertise
+        return tuple(expertise)
     
     @classmethod
     def _calculate_workload_capacity(cls, seniority_level: int) -> float:
         """Calculate workload capacity based on seniority."""
-        # Higher seniority = higher capacity (more resources, delegation ability)
-        base_capacity = 0.8 + (seniority_level * 0.1)
-        return min(1.5, base_capacity)  # Cap at 1.5x normal capacity
+        if 0 <= seniority_level < len(WORKLOAD_CAPACITY_BY_SENIORITY):
+            return WORKLOAD_CAPACITY_BY_SENIORITY[seniority_level]
+        return _workload_capacity(seniority_level)
     
     @classmethod
     def _determine_initial_state(cls) -> AgentState:
         """Determine initial agent state with realistic distribution."""
-        states = [
-            (AgentState.AVAILABLE, 0.6),
-            (AgentState.BUSY, 0.3),
-            (AgentState.IN_MEETING, 0.08),
-            (AgentState.OVERWHELMED, 0.02),
-        ]
-        
-        rand = random.random()
-        cumulative = 0.0
-        for state, probability in states:
-            cumulative += probability
-            if rand <= cumulative:
-                return state
+        index = bisect_left(INITIAL_STATE_CUMULATIVE, random.random())
+        if index < len(INITIAL_STATES):
+            return INITIAL_STATES[index]
         
         return AgentState.AVAILABLE
     
     @classmethod
-    def _find_manager_email(cls, employee_email: str, employee_data: Dict) -> Optional[str]:
-        """Find the manager's email for an employee."""
+    def _build_reporting_index(cls, employee_data: Dict) -> Dict[str, Dict[str, List[str]]]:
+        """Bucket employee emails by department into managers and reports, in input order."""
         # This is a simplified approach - in real data, you'd have explicit manager relationships
-        employee_info = employee_data.get(employee_email, {})
-        department = employee_info.get("department", "")
-        role = employee_info.get("role", "")
-        
-        # Look for managers in the same department
+        reporting_index: Dict[str, Dict[str, List[str]]] = {}
         for email, info in employee_data.items():
-            if email == employee_email:
-                continue
+            role = info.get("role", "")
+            bucket = reporting_index.setdefault(info.get("department", ""), {"managers": [], "reports": []})
             
-            other_role = info.get("role", "").lower()
-            other_dept = info.get("department", "")
-            
-            # Same department and manager role
-            if (other_dept == department and 
-                any(title in other_role for title in ["manager", "director", "vp", "head"])):
-                return email
+            if cls.MANAGER_ROLE_PATTERN.search(role):
+                bucket["managers"].append(email)
+            if not cls.NON_REPORT_ROLE_PATTERN.search(role):
+                bucket["reports"].append(email)
         
-        return None
+        return reporting_index
     
     @classmethod
-    def _find_direct_reports(cls, manager_email: str, employee_data: Dict) -> List[str]:
-        """Find direct reports for a manager."""
-        manager_info = employee_data.get(manager_email, {})
-        manager_dept = manager_info.get("department", "")
-        manager_role = manager_info.get("role", "").lower()
-        
-        # Only managers have direct reports
-        if not any(title in manager_role for title in ["manager", "director", "vp", "ceo", "head"]):
-            return []
+    def _build_reporting_maps(cls, employee_data: Dict) -> Tuple[Dict[str, Optional[str]], Dict[str, List[str]]]:
+        """Derive every employee's manager and direct reports (by email) in one pass."""
+        reporting_index = cls._build_reporting_index(employee_data)
+        manager_of: Dict[str, Optional[str]] = {}
+        reports_of: Dict[str, List[str]] = {}
         
-        direct_reports = []
         for email, info in employee_data.items():
-            if email == manager_email:
-                continue
+            bucket = reporting_index[info.get("department", "")]
             
-            employee_dept = info.get("department", "")
-            employee_role = info.get("role", "").lower()
+            # The first manager-level colleague in the same department
+            manager_of[email] = next((other for other in bucket["managers"] if other != email), None)
             
-            # Same department, non-manager role (simplified logic)
-            if (employee_dept == manager_dept and 
-                not any(title in employee_role for title in ["manager", "director", "vp", "ceo"])):
-                direct_reports.append(email)
+            # Only managers have direct reports: same department, non-manager role (simplified logic)
+            if cls.DIRECT_REPORT_ROLE_PATTERN.search(info.get("role", "")):
+                reports_of[email] = [other for other in bucket["reports"] if other != email]
         
-        return direct_reports
+        return manager_of, reports_of
     
     @classmethod
-    def _initialize_relationship_scores(cls, agent: SimulationAgent, all_agents: Dict[str, SimulationAgent]) -> None:
+    def _assign_department_ids(cls, agents: Iterable[SimulationAgent]) -> None:
+        """Give each distinct department a small integer code, in first-seen order."""
+        department_ids: Dict[str, int] = {}
+        for agent in agents:
+            professional = agent.professional
+            professional.department_id = department_ids.setdefault(professional.department, len(department_ids))
+    
+    @classmethod
+    def _colleague_groups(cls, all_agents: Dict[str, SimulationAgent]) -> List[Tuple[int, int, List[str]]]:
+        """Group agent ids by (department_id, seniority_level), in first-seen order."""
+        groups: Dict[Tuple[int, int], List[str]] = {}
+        for agent_id, agent in all_agents.items():
+            key = (agent.professional.department_id, agent.professional.seniority_level)
+            groups.setdefault(key, []).append(agent_id)
+        return [(department_id, seniority_level, agent_ids) for (department_id, seniority_level), agent_ids in groups.items()]
+    
+    @classmethod
+    def _relationship_index(cls, colleague_groups: List[Tuple[int, int, List[str]]]) -> Dict[str, int]:
+        """Assign relationship-score columns so that each colleague group is contiguous."""
+        agent_ids = chain.from_iterable(agent_ids for _, _, agent_ids in colleague_groups)
+        return {agent_id: column for column, agent_id in enumerate(agent_ids)}
+    
+    @classmethod
+    def _initialize_relationship_scores(
+        cls,
+        agent: SimulationAgent,
+        all_agents: Dict[str, SimulationAgent],
+        colleague_groups: Optional[List[Tuple[int, int, List[str]]]] = None,
+        relationship_index: Optional[Dict[str, int]] = None
+    ) -> None:
         """Initialize relationship scores with other agents."""
-        for other_agent_id, other_agent in all_agents.items():
-            if other_agent_id == agent.id:
-                continue
-            
+        # This runs once per agent over every other agent. The department and
+        # seniority bonuses are the same for everyone in a colleague group, so the
+        # base score is computed per group and only the variation per colleague.
+        # relationship_index must come from the same colleague_groups: scores are
+        # written as one row in group order.
+        if colleague_groups is None:
+            cls._assign_department_ids([agent, *all_agents.values()])
+            colleague_groups = cls._colleague_groups(all_agents)
+        if relationship_index is None:
+            relationship_index = cls._relationship_index(colleague_groups)
+        
+        department_id = agent.professional.department_id
+        seniority_level = agent.professional.seniority_level
+        row = array("d")
+        rand = random.random
+        
+        for other_department_id, other_seniority_level, other_agent_ids in colleague_groups:
             # Base relationship score
             base_score = 0.5
             
             # Same department bonus
-            if other_agent.professional.department == agent.professional.department:
+            if other_department_id == department_id:
                 base_score += 0.2
             
-            # Manager/direct report relationships
-            if other_agent_id == agent.professional.manager_id:
-                base_score += 0.3  # Good relationship with manager
-            elif other_agent_id in agent.professional.direct_reports:
-                base_score += 0.2  # Good relationship with direct reports
-            
             # Similar seniority levels work well together
-            seniority_diff = abs(agent.professional.seniority_level - other_agent.professional.seniority_level)
-            if seniority_diff <= 1:
+            if abs(seniority_level - other_seniority_level) <= 1:
                 base_score += 0.1
             
-            # Add some random variation
-            variation = random.uniform(-0.2, 0.2)
-            final_score = max(0.0, min(1.0, base_score + variation))
-            
-            agent.memory.relationship_scores[other_agent_id] = final_score
+            # Add some random variation (uniform in ±0.2). The base is at most 0.8
+            # here, so scores already fall within 0.0-1.0 without clamping.
+            low = base_score - 0.2
+            row.extend([low + 0.4 * rand() for _ in other_agent_ids])
+        
+        relationship_scores = RelationshipScores(relationship_index, row)
+        relationship_scores.pop(agent.id, None)
+        
+        # Keep any scores towards members outside this set of agents
+        for other_agent_id, score in agent.memory.relationship_scores.items():
+            if other_agent_id not in relationship_index:
+                relationship_scores[other_agent_id] = score
+        agent.memory.relationship_scores = relationship_scores
+        
+        # Manager/direct report relationships
+        manager_id = agent.professional.manager_id
+        if manager_id in relationship_scores:
+            relationship_scores[manager_id] = min(1.0, relationship_scores[manager_id] + 0.3)  # Good relationship with manager
+        for report_id in agent.professional.direct_reports:
+            if report_id != manager_id and report_id in relationship_scores:
+                relationship_scores[report_id] = min(1.0, relationship_scores[report_id] + 0.2)  # Good relationship with direct reports
@@ -4,7 +4,10 @@ Behavior engine for AI agents in the organizational simulation.
 
 import random
 import logging
-from typing import Dict, List, Optional
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from itertools import accumulate
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 from datetime import datetime, timedelta
 
 from ..domain.models import (
@@ -13,25 +16,147 @@ from ..domain.models import (
     AgentResponse,
     ResponseType,
     CommunicationType,
-    PersonalityTrait,
     AgentState,
+    RESPONSE_TYPES,
+    RESPONSE_TYPE_VALUES,
+    IGNORE_INDEX,
+    TAKE_ACTION_INDEX,
+    SEEK_CLARIFICATION_INDEX,
+    DELEGATE_INDEX,
 )
 
 logger = logging.getLogger(__name__)
 
+# Per-response state changes: ignoring creates some stress, taking action adds
+# workload stress, asking questions adds minimal stress
+STRESS_DELTA = {
+    ResponseType.IGNORE: 0.05,
+    ResponseType.TAKE_ACTION: 0.1,
+    ResponseType.SEEK_CLARIFICATION: 0.02,
+    ResponseType.PROVIDE_WISDOM: 0.0,
+    ResponseType.ESCALATE: 0.0,
+    ResponseType.DELEGATE: 0.0,
+}
+WORKLOAD_DELTA = {
+    ResponseType.IGNORE: 0.0,
+    ResponseType.TAKE_ACTION: 0.1,
+    ResponseType.SEEK_CLARIFICATION: 0.0,
+    ResponseType.PROVIDE_WISDOM: 0.0,
+    ResponseType.ESCALATE: 0.0,
+    ResponseType.DELEGATE: 0.0,
+}
+# Only these responses change the relationship with the sender
+RELATIONSHIP_DELTA = {
+    ResponseType.TAKE_ACTION: 0.05,
+    ResponseType.IGNORE: -0.1,
+}
+
+# Response rates that override personality for agents in these states
+RESPONSE_RATE_BY_STATE = {
+    AgentState.ON_LEAVE: 0.0,
+    AgentState.OVERWHELMED: 0.3,
+}
+RESPONSE_RATE_BY_STATE_NON_URGENT = {**RESPONSE_RATE_BY_STATE, AgentState.BUSY: 0.6}
+
+# Responses that commit the agent to acting on the communication
+ACTION_RESPONSE_TYPES = (ResponseType.TAKE_ACTION, ResponseType.DELEGATE)
+
+# (take action, ignore) multipliers for a poor (< 0.3), neutral and good (> 0.7)
+# relationship with the sender
+RELATIONSHIP_MULTIPLIERS = ((0.8, 1.4), (1.0, 1.0), (1.3, 0.7))
+
+# Take-action multiplier by priority level, 1 (low) to 5 (critical)
+PRIORITY_ACTION_MULTIPLIERS = {level: 1.0 + (level - 3) * 0.2 for level in range(1, 6)}
+
+# Range of hours to complete a requested action, by priority level
+COMPLETION_HOURS_BY_PRIORITY = {
+    1: (24, 72),  # Low priority: 1-3 days
+    2: (12, 48),  # Medium-low: 0.5-2 days
+    3: (8, 24),   # Medium: 8-24 hours
+    4: (4, 12),   # High: 4-12 hours
+    5: (1, 6),    # Critical: 1-6 hours
+}
+
+# Response templates, shared by every call rather than rebuilt per response
+IGNORE_REASONS = (
+    "Too busy with current priorities",
+    "Unclear on the relevance to my role",
+    "Waiting for more information",
+    "Focusing on higher priority tasks",
+    "Need to discuss with team first",
+)
+
+ACTION_RESPONSES_DIRECT = (
+    "Will handle this immediately.",
+    "On it. Expected completion by end of day.",
+    "Understood. Taking action now.",
+    "Got it. Will prioritize this.",
+)
+
+ACTION_RESPONSES_DIPLOMATIC = (
+    "Thank you for bringing this to my attention. I'll address this promptly.",
+    "I appreciate the guidance. I'll work on this right away.",
+    "This aligns well with our objectives. I'll get started on this.",
+    "I understand the importance of this. Will make it a priority.",
+)
+
+CLARIFICATION_QUESTIONS = (
+    "Could you provide more details on the expected timeline?",
+    "What resources will be available for this initiative?",
+    "How does this align with our current quarterly objectives?",
+    "Should this take priority over existing commitments?",
+    "What would success look like for this project?",
+    "Are there specific stakeholders I should coordinate with?",
+)
+
+FEEDBACK_TEMPLATES = (
+    "Based on my experience with {expertise}, I think we should consider...",
+    "From a {expertise} perspective, this could impact...",
+    "I've seen similar initiatives succeed when we focus on...",
+    "One potential challenge I foresee is...",
+    "This reminds me of a successful project where we...",
+)
+
+# Templates split around the placeholder, so filling one in is a single join
+FEEDBACK_TEMPLATE_PARTS = tuple(tuple(template.split("{expertise}")) for template in FEEDBACK_TEMPLATES)
+
+ESCALATION_REASONS = (
+    "This requires approval from my manager before proceeding.",
+    "I need to coordinate with other departments on this.",
+    "This impacts our budget and needs finance review.",
+    "The scope is beyond my current authority level.",
+    "This conflicts with other strategic priorities.",
+)
+
+DELEGATION_MESSAGES = (
+    "I'll assign this to my team and ensure proper oversight.",
+    "This is a great opportunity for my team to take ownership.",
+    "I'll delegate this to the appropriate team member.",
+    "My team has the right expertise to handle this effectively.",
+)
+
+
+@lru_cache(maxsize=1024)
+def _readable_expertise(expertise_areas: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Expertise areas as they read in prose; agents share a few role-based tuples."""
+    return tuple(area.replace("_", " ") for area in expertise_areas)
+
 
 class BehaviorEngine:
     """Engine that determines how agents behave and respond to communications."""
     
-    def __init__(self) -> None:
-        self.response_generators = {
-            ResponseType.IGNORE: self._generate_ignore_response,
-            ResponseType.TAKE_ACTION: self._generate_action_response,
-            ResponseType.SEEK_CLARIFICATION: self._generate_clarification_response,
-            ResponseType.PROVIDE_WISDOM: self._generate_feedback_response,
-            ResponseType.ESCALATE: self._generate_escalation_response,
-            ResponseType.DELEGATE: self._generate_delegation_response,
-        }
+    def __init__(self, rng: Optional[random.Random] = None) -> None:
+        # Each engine draws from its own generator so runs can be seeded independently
+        self.rng = rng if rng is not None else random.Random()
+        # Generators in ResponseType order, indexed by position rather than hashed by enum
+        self.response_generators = (
+            self._generate_ignore_response,  # IGNORE
+            self._generate_action_response,  # TAKE_ACTION
+            self._generate_clarification_response,  # SEEK_CLARIFICATION
+            self._generate_feedback_response,  # PROVIDE_WISDOM
+            self._generate_escalation_response,  # ESCALATE
+            self._generate_delegation_response,  # DELEGATE
+        )
     
     def process_communication(
         self,
@@ -45,123 +170,173 @@ class BehaviorEngine:
         if not self._should_respond(agent, communication):
             return None
         
-        # Calculate response probabilities based on personality and context
-        response_probabilities = agent.calculate_response_probability(communication)
+        return self._respond(agent, communication, all_agents)
+    
+    def process_communications_batch(
+        self,
+        agents: Iterable[SimulationAgent],
+        communication: PriorityCommunication,
+        all_agents: Dict[str, SimulationAgent]
+    ) -> List[AgentResponse]:
+        """Process a communication for many recipients in a single pass.
+        
+        Whether each recipient responds is decided up front for the whole batch;
+        responses are then generated in recipient order.
+        """
+        
+        agents = list(agents)
+        respond = self._respond
+        
+        return [
+            respond(agent, communication, all_agents)
+            for agent, responds in zip(agents, self._should_respond_mask(agents, communication))
+            if responds
+        ]
+    
+    def _respond(
+        self,
+        agent: SimulationAgent,
+        communication: PriorityCommunication,
+        all_agents: Dict[str, SimulationAgent]
+    ) -> AgentResponse:
+        """Generate and record the response of an agent that chose to respond."""
+        
+        # Calculate response weights based on personality and context
+        response_weights = agent.calculate_response_weights(communication)
         
-        # Adjust probabilities based on current context
-        response_probabilities = self._adjust_probabilities_for_context(
-            agent, communication, response_probabilities, all_agents
+        # Adjust weights based on current context
+        response_weights = self._adjust_weights_for_context(
+            agent, communication, response_weights, all_agents
         )
         
-        # Select response type based on probabilities
-        response_type = self._select_response_type(response_probabilities)
+        # Select response type based on weights
+        response_index = self._select_response_type(response_weights)
         
         # Generate the actual response
-        response = self._generate_response(agent, communication, response_type, all_agents)
+        response = self._generate_response(agent, communication, response_index, all_agents)
         
         # Update agent's memory and state
         self._update_agent_after_response(agent, communication, response)
         
-        logger.info(f"Agent {agent.name} responded to communication with {response_type.value}")
+        # Lazy arguments defer formatting until INFO is enabled; this runs for every response
+        logger.info(
+            "Agent %s responded to communication with %s",
+            agent.name, RESPONSE_TYPE_VALUES[response.response_type]
+        )
         return response
     
     def _should_respond(self, agent: SimulationAgent, communication: PriorityCommunication) -> bool:
         """Determine if an agent should respond to a communication."""
+        return self._should_respond_mask((agent,), communication)[0]
+    
+    def _should_respond_mask(
+        self,
+        agents: Sequence[SimulationAgent],
+        communication: PriorityCommunication
+    ) -> List[bool]:
+        """Determine for each agent whether it responds to a communication."""
         
-        # Agents on leave don't respond
-        if agent.current_state == AgentState.ON_LEAVE:
-            return False
-        
-        # Overwhelmed agents have reduced response rate
-        if agent.current_state == AgentState.OVERWHELMED:
-            return random.random() < 0.3
-        
-        # Busy agents have reduced response rate for non-urgent communications
-        if agent.current_state == AgentState.BUSY and communication.priority_level < 4:
-            return random.random() < 0.6
-        
-        # Direct orders almost always get responses
-        if communication.type == CommunicationType.ORDER:
-            return random.random() < 0.95
-        
-        # Base response rate varies by personality
-        authority_response = agent.personality.get_trait(PersonalityTrait.AUTHORITY_RESPONSE)
-        base_response_rate = 0.5 + (authority_response * 0.3)
-        
-        return random.random() < base_response_rate
+        # Agents on leave don't respond and overwhelmed agents rarely do; busy
+        # agents also hold back on non-urgent communications
+        if communication.priority_level < 4:
+            state_rates = RESPONSE_RATE_BY_STATE_NON_URGENT
+        else:
+            state_rates = RESPONSE_RATE_BY_STATE
+        
+        # Direct orders almost always get responses, otherwise the base response
+        # rate varies by personality
+        order_rate = 0.95 if communication.type == CommunicationType.ORDER else None
+        
+        draw = self.rng.random
+        mask = []
+        for agent in agents:
+            rate = state_rates.get(agent.current_state)
+            if rate is None:
+                rate = order_rate if order_rate is not None else 0.5 + agent.personality.authority_response * 0.3
+            mask.append(draw() < rate)
+        return mask
     
-    def _adjust_probabilities_for_context(
+    def _adjust_weights_for_context(
         self,
         agent: SimulationAgent,
         communication: PriorityCommunication,
-        base_probabilities: Dict[ResponseType, float],
+        weights: List[float],
         all_agents: Dict[str, SimulationAgent]
-    ) -> Dict[ResponseType, float]:
-        """Adjust response probabilities based on current context."""
+    ) -> List[float]:
+        """Adjust response weights in place based on current context.
         
-        adjusted = base_probabilities.copy()
+        Weights are left unnormalized; _select_response_type scales by their total.
+        """
         
-        # Relationship with sender affects response
-        sender_relationship = agent.memory.relationship_scores.get(communication.sender_id, 0.5)
+        memory = agent.memory
+        professional = agent.professional
         
-        if sender_relationship > 0.7:  # Good relationship
-            adjusted[ResponseType.TAKE_ACTION] *= 1.3
-            adjusted[ResponseType.IGNORE] *= 0.7
-        elif sender_relationship < 0.3:  # Poor relationship
-            adjusted[ResponseType.IGNORE] *= 1.4
-            adjusted[ResponseType.TAKE_ACTION] *= 0.8
+        # Relationship with sender affects response
+        sender_relationship = memory.relationship_scores.get(communication.sender_id, 0.5)
+        relationship_bucket = (sender_relationship >= 0.3) + (sender_relationship > 0.7)
+        action_multiplier, ignore_multiplier = RELATIONSHIP_MULTIPLIERS[relationship_bucket]
         
         # High stress reduces compliance
-        if agent.memory.stress_level > 0.7:
-            adjusted[ResponseType.IGNORE] *= 1.2
-            adjusted[ResponseType.SEEK_CLARIFICATION] *= 1.1
+        clarification_multiplier = 1.0
+        if memory.stress_level > 0.7:
+            ignore_multiplier *= 1.2
+            clarification_multiplier = 1.1
         
         # High workload affects response
-        workload_ratio = agent.professional.current_workload / agent.professional.workload_capacity
-        if workload_ratio > 0.8:
-            adjusted[ResponseType.IGNORE] *= 1.3
-            adjusted[ResponseType.DELEGATE] *= 1.2
+        delegate_multiplier = 1.0
+        if professional.current_workload / professional.workload_capacity > 0.8:
+            ignore_multiplier *= 1.3
+            delegate_multiplier = 1.2
         
         # Priority level affects response
-        priority_multiplier = 1.0 + (communication.priority_level - 3) * 0.2
-        adjusted[ResponseType.TAKE_ACTION] *= priority_multiplier
-        
-        # Normalize probabilities
-        total = sum(adjusted.values())
-        return {k: v / total for k, v in adjusted.items()}
+        priority_level = communication.priority_level
+        priority_multiplier = PRIORITY_ACTION_MULTIPLIERS.get(priority_level)
+        if priority_multiplier is None:
+            priority_multiplier = 1.0 + (priority_level - 3) * 0.2
+        action_multiplier *= priority_multiplier
+        
+        # Apply all adjustments in one pass
+        weights[TAKE_ACTION_INDEX] *= action_multiplier
+        weights[IGNORE_INDEX] *= ignore_multiplier
+        weights[SEEK_CLARIFICATION_INDEX] *= clarification_multiplier
+        weights[DELEGATE_INDEX] *= delegate_multiplier
+        
+        return weights
     
-    def _select_response_type(self, probabilities: Dict[ResponseType, float]) -> ResponseType:
-        """Select a response type based on probabilities."""
-        rand = random.random()
-        cumulative = 0.0
-        
-        for response_type, probability in probabilities.items():
-            cumulative += probability
-            if rand <= cumulative:
-                return response_type
-        
-        # Fallback
-        return ResponseType.IGNORE
+    def _select_response_type(self, weights: Sequence[float]) -> int:
+        """Select a response type based on weights, returning its index in RESPONSE_TYPES."""
+        cumulative = list(accumulate(weights))
+        total = cumulative[-1]
+        
+        # bisect_right never lands on a zero-weight slot
+        index = bisect_right(cumulative, self.rng.random() * total)
+        if index == len(cumulative):  # Rounding pushed the draw onto the total
+            index = bisect_left(cumulative, total)
+        return index
     
     def _generate_response(
         self,
         agent: SimulationAgent,
         communication: PriorityCommunication,
-        response_type: ResponseType,
+        response_index: int,
         all_agents: Dict[str, SimulationAgent]
     ) -> AgentResponse:
-        """Generate the actual response content."""
+        """Generate the actual response content for the response type at response_index."""
         
-        generator = self.response_generators.get(response_type, self._generate_ignore_response)
+        response_type = RESPONSE_TYPES[response_index]
+        generator = self.response_generators[response_index]
         content, sentiment, confidence = generator(agent, communication, all_agents)
         
         # Determine if action will be taken
-        action_taken = response_type in [ResponseType.TAKE_ACTION, ResponseType.DELEGATE]
+        action_taken = response_type in ACTION_RESPONSE_TYPES
+        
+        # One clock read per response, shared by its timestamps
+        now = datetime.now()
         
         # Estimate completion time if action is taken
         completion_time = None
         if action_taken:
-            completion_time = self._estimate_completion_time(agent, communication)
+            completion_time = self._estimate_completion_time(agent, communication, now)
         
         return AgentResponse(
             agent_id=agent.id,
@@ -170,6 +345,7 @@ class BehaviorEngine:
             content=content,
             sentiment=sentiment,
             confidence=confidence,
+            created_at=now,
             action_taken=action_taken,
             estimated_completion_time=completion_time,
         )
@@ -182,15 +358,7 @@ class BehaviorEngine:
     ) -> tuple[str, float, float]:
         """Generate an ignore response (no actual response sent)."""
         
-        reasons = [
-            "Too busy with current priorities",
-            "Unclear on the relevance to my role",
-            "Waiting for more information",
-            "Focusing on higher priority tasks",
-            "Need to discuss with team first",
-        ]
-        
-        reason = random.choice(reasons)
+        reason = self.rng.choice(IGNORE_REASONS)
         return f"[Internal: {reason}]", 0.0, 0.3
     
     def _generate_action_response(
@@ -201,26 +369,16 @@ class BehaviorEngine:
     ) -> tuple[str, float, float]:
         """Generate a positive action response."""
         
-        communication_style = agent.personality.get_trait(PersonalityTrait.COMMUNICATION_STYLE)
+        communication_style = agent.personality.communication_style
         
         if communication_style > 0.7:  # Direct style
-            responses = [
-                "Will handle this immediately.",
-                "On it. Expected completion by end of day.",
-                "Understood. Taking action now.",
-                "Got it. Will prioritize this.",
-            ]
+            responses = ACTION_RESPONSES_DIRECT
         else:  # Diplomatic style
-            responses = [
-                "Thank you for bringing this to my attention. I'll address this promptly.",
-                "I appreciate the guidance. I'll work on this right away.",
-                "This aligns well with our objectives. I'll get started on this.",
-                "I understand the importance of this. Will make it a priority.",
-            ]
+            responses = ACTION_RESPONSES_DIPLOMATIC
         
-        response = random.choice(responses)
-        sentiment = random.uniform(0.3, 0.8)
-        confidence = random.uniform(0.6, 0.9)
+        response = self.rng.choice(responses)
+        sentiment = self.rng.uniform(0.3, 0.8)
+        confidence = self.rng.uniform(0.6, 0.9)
         
         return response, sentiment, confidence
     
@@ -232,18 +390,9 @@ class BehaviorEngine:
     ) -> tuple[str, float, float]:
         """Generate a clarification-seeking response."""
         
-        questions = [
-            "Could you provide more details on the expected timeline?",
-            "What resources will be available for this initiative?",
-            "How does this align with our current quarterly objectives?",
-            "Should this take priority over existing commitments?",
-            "What would success look like for this project?",
-            "Are there specific stakeholders I should coordinate with?",
-        ]
-        
-        question = random.choice(questions)
-        sentiment = random.uniform(0.1, 0.5)
-        confidence = random.uniform(0.4, 0.7)
+        question = self.rng.choice(CLARIFICATION_QUESTIONS)
+        sentiment = self.rng.uniform(0.1, 0.5)
+        confidence = self.rng.uniform(0.4, 0.7)
         
         return question, sentiment, confidence
     
@@ -255,22 +404,13 @@ class BehaviorEngine:
     ) -> tuple[str, float, float]:
         """Generate a feedback response."""
         
-        expertise_areas = agent.professional.expertise_areas
+        expertise_areas = _readable_expertise(tuple(agent.professional.expertise_areas))
         
-        feedback_types = [
-            "Based on my experience with {expertise}, I think we should consider...",
-            "From a {expertise} perspective, this could impact...",
-            "I've seen similar initiatives succeed when we focus on...",
-            "One potential challenge I foresee is...",
-            "This reminds me of a successful project where we...",
-        ]
+        expertise = self.rng.choice(expertise_areas) if expertise_areas else "general business"
+        feedback = expertise.join(self.rng.choice(FEEDBACK_TEMPLATE_PARTS))
         
-        expertise = random.choice(expertise_areas) if expertise_areas else "general business"
-        feedback_template = random.choice(feedback_types)
-        feedback = feedback_template.format(expertise=expertise.replace("_", " "))
-        
-        sentiment = random.uniform(0.2, 0.7)
-        confidence = random.uniform(0.5, 0.8)
+        sentiment = self.rng.uniform(0.2, 0.7)
+        confidence = self.rng.uniform(0.5, 0.8)
         
         return feedback, sentiment, confidence
     
@@ -282,17 +422,9 @@ class BehaviorEngine:
     ) -> tuple[str, float, float]:
         """Generate an escalation response."""
         
-        escalation_reasons = [
-            "This requires approval from my manager before proceeding.",
-            "I need to coordinate with other departments on this.",
-            "This impacts our budget and needs finance review.",
-            "The scope is beyond my current authority level.",
-            "This conflicts with other strategic priorities.",
-        ]
-        
-        reason = random.choice(escalation_reasons)
-        sentiment = random.uniform(-0.2, 0.3)
-        confidence = random.uniform(0.6, 0.8)
+        reason = self.rng.choice(ESCALATION_REASONS)
+        sentiment = self.rng.uniform(-0.2, 0.3)
+        confidence = self.rng.uniform(0.6, 0.8)
         
         return reason, sentiment, confidence
     
@@ -308,46 +440,32 @@ class BehaviorEngine:
             # Can't delegate, fall back to action
             return self._generate_action_response(agent, communication, all_agents)
         
-        delegation_messages = [
-            "I'll assign this to my team and ensure proper oversight.",
-            "This is a great opportunity for my team to take ownership.",
-            "I'll delegate this to the appropriate team member.",
-            "My team has the right expertise to handle this effectively.",
-        ]
-        
-        message = random.choice(delegation_messages)
-        sentiment = random.uniform(0.3, 0.6)
-        confidence = random.uniform(0.7, 0.9)
+        message = self.rng.choice(DELEGATION_MESSAGES)
+        sentiment = self.rng.uniform(0.3, 0.6)
+        confidence = self.rng.uniform(0.7, 0.9)
         
         return message, sentiment, confidence
     
     def _estimate_completion_time(
         self,
         agent: SimulationAgent,
-        communication: PriorityCommunication
+        communication: PriorityCommunication,
+        now: Optional[datetime] = None
     ) -> datetime:
         """Estimate when the agent will complete the requested action."""
         
-        # Base completion time based on priority and complexity
-        base_hours = {
-            1: random.uniform(24, 72),    # Low priority: 1-3 days
-            2: random.uniform(12, 48),    # Medium-low: 0.5-2 days
-            3: random.uniform(8, 24),     # Medium: 8-24 hours
-            4: random.uniform(4, 12),     # High: 4-12 hours
-            5: random.uniform(1, 6),      # Critical: 1-6 hours
-        }
-        
-        hours = base_hours.get(communication.priority_level, 24)
+        # Base completion time based on priority and complexity; only the
+        # communication's own priority range is drawn from
+        hour_range = COMPLETION_HOURS_BY_PRIORITY.get(communication.priority_level)
+        hours = self.rng.uniform(*hour_range) if hour_range else 24.0
         
-        # Adjust based on agent's workload
-        workload_ratio = agent.professional.current_workload / agent.professional.workload_capacity
-        hours *= (1 + workload_ratio)
+        # Adjust based on agent's workload and seniority (higher seniority = more resources)
+        professional = agent.professional
+        workload_ratio = professional.current_workload / professional.workload_capacity
+        seniority_factor = 1.0 - (professional.seniority_level - 1) * 0.1
+        hours *= (1 + workload_ratio) * seniority_factor
         
-        # Adjust based on agent's seniority (higher seniority = more resources)
-        seniority_factor = 1.0 - (agent.professional.seniority_level - 1) * 0.1
-        hours *= seniority_factor
-        
-        return datetime.now() + timedelta(hours=hours)
+        return (now or datetime.now()) + timedelta(hours=hours)
     
     def _update_agent_after_response(
         self,
@@ -357,45 +475,30 @@ class BehaviorEngine:
     ) -> None:
         """Update agent's state and memory after responding."""
         
+        response_type = response.response_type
+        memory = agent.memory
+        
         # Update interaction history
-        interaction = {
-            "timestamp": datetime.now().isoformat(),
-            "communication_id": communication.id,
-            "sender_id": communication.sender_id,
-            "response_type": response.response_type.value,
-            "sentiment": response.sentiment,
-        }
-        agent.memory.interaction_history.append(interaction)
-        
-        # Update stress level based on response type and workload
-        if response.response_type == ResponseType.IGNORE:
-            agent.memory.stress_level += 0.05  # Ignoring creates some stress
-        elif response.response_type == ResponseType.TAKE_ACTION:
-            agent.memory.stress_level += 0.1   # Taking action increases workload stress
-            agent.professional.current_workload += 0.1
-        elif response.response_type == ResponseType.SEEK_CLARIFICATION:
-            agent.memory.stress_level += 0.02  # Minimal stress from asking questions
-        
-        # Cap stress level
-        agent.memory.stress_level = min(1.0, agent.memory.stress_level)
-        
-        # Cap workload
-        agent.professional.current_workload = min(
-            agent.professional.workload_capacity * 1.2,  # Can go 20% over capacity
-            agent.professional.current_workload
+        memory.interaction_history.record(
+            communication.id, communication.sender_id, response_type, response.sentiment
         )
+        professional = agent.professional
+        capacity = professional.workload_capacity
         
-        # Update relationship with sender based on response
-        sender_id = communication.sender_id
-        current_relationship = agent.memory.relationship_scores.get(sender_id, 0.5)
+        # Update stress (capped at 1.0) and workload (can go 20% over capacity)
+        memory.stress_level = min(1.0, memory.stress_level + STRESS_DELTA[response_type])
+        workload = min(capacity * 1.2, professional.current_workload + WORKLOAD_DELTA[response_type])
+        professional.current_workload = workload
         
-        if response.response_type == ResponseType.TAKE_ACTION:
-            agent.memory.relationship_scores[sender_id] = min(1.0, current_relationship + 0.05)
-        elif response.response_type == ResponseType.IGNORE:
-            agent.memory.relationship_scores[sender_id] = max(0.0, current_relationship - 0.1)
+        # Update relationship with sender based on response
+        relationship_delta = RELATIONSHIP_DELTA.get(response_type)
+        if relationship_delta is not None:
+            sender_id = communication.sender_id
+            current_relationship = memory.relationship_scores.get(sender_id, 0.5)
+            memory.relationship_scores[sender_id] = max(0.0, min(1.0, current_relationship + relationship_delta))
         
         # Update agent state based on workload
-        workload_ratio = agent.professional.current_workload / agent.professional.workload_capacity
+        workload_ratio = workload / capacity
         if workload_ratio > 1.1:
             agent.current_state = AgentState.OVERWHELMED
         elif workload_ratio > 0.8:
@@ -403,4 +506,4 @@ class BehaviorEngine:
         else:
             agent.current_state = AgentState.AVAILABLE
         
-        agent.memory.last_updated = datetime.now()
+        memory.last_updated = response.created_at
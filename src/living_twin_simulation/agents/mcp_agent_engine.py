@@ -3,10 +3,18 @@ MCP-enhanced AI agent engine for realistic organizational simulation.
 """
 
 import asyncio
+import hashlib
 import json
 import logging
-from typing import Dict, List, Optional, Any
-from datetime import datetime
+import random
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Any
+from datetime import datetime, timedelta
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
 
 from ..domain.models import (
     SimulationAgent,
@@ -19,12 +27,142 @@ from ..domain.models import (
 logger = logging.getLogger(__name__)
 
 
+def _json_loads(data: str) -> Any:
+    """Parse model output as JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Response type names the model may answer with; the prompt still says
+# "provide_feedback" for what the domain now calls PROVIDE_WISDOM
+AI_RESPONSE_TYPES = {response_type.value: response_type for response_type in ResponseType}
+AI_RESPONSE_TYPES["provide_feedback"] = ResponseType.PROVIDE_WISDOM
+
+# Fields requested from the model, with the value assumed when a reply omits one
+AI_RESPONSE_DEFAULTS: Dict[str, Any] = {
+    "response_type": "ignore",
+    "content": "",
+    "reasoning": "",
+    "sentiment": 0.0,
+    "confidence": 0.5,
+    "action_taken": False,
+    "estimated_hours": 0,
+    "stress_delta": None,
+}
+
+# Models used for AI responses; routine communications go to the cheaper one
+PRIMARY_MODEL = "gpt-4"
+ROUTINE_MODEL = "gpt-4o-mini"
+PRIMARY_MODEL_MIN_PRIORITY = 4
+
+
+def default_model_router(priority_level: int) -> str:
+    """Pick the chat model for a communication of the given priority."""
+    return PRIMARY_MODEL if priority_level >= PRIMARY_MODEL_MIN_PRIORITY else ROUTINE_MODEL
+
+
+def build_peer_index(all_agents: Dict[str, SimulationAgent]) -> Dict[Tuple[str, int], List[str]]:
+    """Index agent ids by (department, seniority).
+    
+    Build it once per roster and pass it to generate_proactive_communication when
+    generating for many agents; rebuild it whenever agents or their profiles change.
+    """
+    index: Dict[Tuple[str, int], List[str]] = {}
+    for agent in all_agents.values():
+        key = (agent.professional.department, agent.professional.seniority_level)
+        index.setdefault(key, []).append(agent.id)
+    return index
+
+
+# (trait, description above 0.7, description below 0.3) for persona prompts
+PERSONALITY_DESCRIPTIONS = (
+    (PersonalityTrait.RISK_TOLERANCE,
+     "You're comfortable taking risks and trying new approaches",
+     "You prefer proven methods and are cautious about risks"),
+    (PersonalityTrait.AUTHORITY_RESPONSE,
+     "You generally follow directions from leadership",
+     "You tend to question authority and think independently"),
+    (PersonalityTrait.COMMUNICATION_STYLE,
+     "You communicate directly and assertively",
+     "You prefer diplomatic and tactful communication"),
+    (PersonalityTrait.CHANGE_ADAPTABILITY,
+     "You adapt quickly to changes and new situations",
+     "You prefer stability and are resistant to change"),
+    (PersonalityTrait.WORKLOAD_SENSITIVITY,
+     "You become stressed easily when workload increases",
+     "You handle high workloads well without much stress"),
+    (PersonalityTrait.COLLABORATION_PREFERENCE,
+     "You enjoy working with others and value teamwork",
+     "You prefer working independently"),
+)
+
+# Closing instructions shared by every persona prompt
+PERSONA_GUIDANCE = """
+You should respond authentically as this person would, considering:
+- Your personality traits and communication style
+- Your current workload and stress level
+- Your role and responsibilities
+- Your relationship with the person contacting you
+- The priority and type of communication
+"""
+
+# Reasoning prompt rendered once per communication; positional %-fields are
+# persona, sender name, sender role, priority, type, content, relationship,
+# workload utilization, stress level and current state
+REASONING_PROMPT_TEMPLATE = """
+%s
+
+You've received the following communication:
+---
+From: %s (%s)
+Priority: %s/5
+Type: %s
+Content: %s
+---
+
+Context:
+- Your relationship with sender: %.1f/1.0
+- Your current workload: %.1fx capacity
+- Your stress level: %.1f/1.0
+- Your current state: %s
+
+Based on your personality, role, and current situation, how would you respond?
+
+Provide your response in JSON format:
+{
+    "response_type": "take_action|ignore|seek_clarification|provide_feedback|escalate|delegate",
+    "content": "Your actual response message",
+    "reasoning": "Why you chose this response",
+    "sentiment": 0.5,  // -1 (negative) to 1 (positive)
+    "confidence": 0.8,  // 0 to 1
+    "action_taken": true,  // Will you actually do something?
+    "estimated_hours": 4,  // If action_taken, how many hours to complete?
+    "stress_delta": 0.05  // How your stress level changes, -0.1 to 0.2
+}
+"""
+
+
 class MCPAgentEngine:
     """AI-powered agent engine using MCP for intelligent behavior."""
     
-    def __init__(self, mcp_client):
+    def __init__(
+        self,
+        mcp_client,
+        max_concurrent_requests: int = 8,
+        response_cache_size: int = 1024,
+        model_router: Optional[Callable[[int], str]] = None,
+        rng: Optional[random.Random] = None
+    ):
         self.mcp_client = mcp_client
-        self.agent_contexts = {}  # Cache for agent conversation contexts
+        self.rng = rng if rng is not None else random.Random()
+        self.model_router = model_router or default_model_router  # Priority level -> model name
+        self.agent_contexts = {}  # Cached persona prompt parts per agent id
+        self.max_concurrent_requests = max_concurrent_requests  # In-flight agents per batch
+        
+        # Parsed AI responses keyed by a digest of the full prompt, least recently used first
+        self.response_cache_size = response_cache_size
+        self._response_cache: OrderedDict[bytes, Dict[str, Any]] = OrderedDict()
     
     async def process_communication_with_ai(
         self,
@@ -34,8 +172,8 @@ class MCPAgentEngine:
     ) -> Optional[AgentResponse]:
         """Process communication using AI reasoning instead of rules."""
         
-        # Build rich context for the AI agent
-        context = await self._build_agent_context(agent, communication, all_agents)
+        # Build the context the reasoning prompt renders
+        context = self._build_prompt_context(agent, communication, all_agents)
         
         # Use MCP to get AI-powered response
         ai_response = await self._get_ai_response(agent, communication, context)
@@ -51,53 +189,45 @@ class MCPAgentEngine:
         
         return structured_response
     
-    async def _build_agent_context(
+    async def process_communications_batch_with_ai(
         self,
-        agent: SimulationAgent,
+        agents: Iterable[SimulationAgent],
         communication: PriorityCommunication,
         all_agents: Dict[str, SimulationAgent]
-    ) -> Dict[str, Any]:
-        """Build comprehensive context for AI reasoning."""
+    ) -> List[AgentResponse]:
+        """Process a communication for many agents with their MCP calls in flight together.
         
-        # Get sender information
-        sender = all_agents.get(communication.sender_id)
-        sender_context = {
-            "name": sender.name if sender else "Unknown",
-            "role": sender.professional.role if sender else "Unknown",
-            "relationship_score": agent.memory.relationship_scores.get(communication.sender_id, 0.5)
-        }
+        Agents are processed concurrently, bounded by max_concurrent_requests, so a
+        broadcast costs roughly one round-trip per batch instead of one per agent.
+        Responses are returned in agent order; agents that did not respond are skipped.
+        """
         
-        # Get recent company knowledge if relevant
-        company_context = None
-        if hasattr(self.mcp_client, 'search_company_knowledge'):
-            try:
-                company_context = await self.mcp_client.use_tool("rag_search", {
-                    "query": communication.content[:200],  # First 200 chars
-                    "tenant_id": agent.organization_id,
-                    "limit": 3
-                })
-            except Exception as e:
-                logger.warning(f"Failed to get company context: {e}")
-        
-        # Build personality description
-        personality_desc = self._describe_personality(agent.personality)
+        request_slots = asyncio.Semaphore(self.max_concurrent_requests)
+        
+        async def process(agent: SimulationAgent) -> Optional[AgentResponse]:
+            async with request_slots:
+                return await self.process_communication_with_ai(agent, communication, all_agents)
+        
+        responses = await asyncio.gather(*(process(agent) for agent in agents))
+        return [response for response in responses if response]
+    
+    def _build_prompt_context(
+        self,
+        agent: SimulationAgent,
+        communication: PriorityCommunication,
+        all_agents: Dict[str, SimulationAgent]
+    ) -> Dict[str, Any]:
+        """Build the context interpolated into the reasoning prompt, and nothing more.
         
-        # Recent interaction patterns
-        recent_interactions = agent.memory.interaction_history[-10:] if agent.memory.interaction_history else []
+        Static persona details come from the per-agent persona cache.
+        """
         
+        professional = agent.professional
         return {
             "agent": {
-                "name": agent.name,
-                "role": agent.professional.role,
-                "department": agent.professional.department,
-                "seniority_level": agent.professional.seniority_level,
-                "expertise_areas": agent.professional.expertise_areas,
-                "personality": personality_desc,
                 "current_state": agent.current_state.value,
                 "workload": {
-                    "current": agent.professional.current_workload,
-                    "capacity": agent.professional.workload_capacity,
-                    "utilization": agent.professional.current_workload / agent.professional.workload_capacity
+                    "utilization": professional.current_workload / professional.workload_capacity
                 },
                 "stress_level": agent.memory.stress_level
             },
@@ -105,19 +235,22 @@ class MCPAgentEngine:
                 "content": communication.content,
                 "type": communication.type.value,
                 "priority": communication.priority_level,
-                "sender": sender_context,
-                "timestamp": communication.timestamp.isoformat()
+                "sender": self._sender_context(agent, communication, all_agents),
             },
-            "company_context": company_context,
-            "recent_interactions": recent_interactions,
-            "organizational_relationships": {
-                "manager": agent.professional.manager_id,
-                "direct_reports": agent.professional.direct_reports,
-                "key_relationships": {
-                    agent_id: score for agent_id, score in agent.memory.relationship_scores.items()
-                    if score > 0.7 or score < 0.3  # Only significant relationships
-                }
-            }
+        }
+    
+    def _sender_context(
+        self,
+        agent: SimulationAgent,
+        communication: PriorityCommunication,
+        all_agents: Dict[str, SimulationAgent]
+    ) -> Dict[str, Any]:
+        """Describe the sender of a communication from the agent's point of view."""
+        sender = all_agents.get(communication.sender_id)
+        return {
+            "name": sender.name if sender else "Unknown",
+            "role": sender.professional.role if sender else "Unknown",
+            "relationship_score": agent.memory.relationship_scores.get(communication.sender_id, 0.5)
         }
     
     async def _get_ai_response(
@@ -129,40 +262,34 @@ class MCPAgentEngine:
         """Get AI-powered response using MCP reasoning tools."""
         
         # Create a realistic persona prompt
-        persona_prompt = self._create_persona_prompt(context["agent"])
+        persona_prompt = self._create_persona_prompt(agent, context["agent"])
         
         # Create the reasoning prompt
-        reasoning_prompt = f"""
-{persona_prompt}
-
-You've received the following communication:
----
-From: {context['communication']['sender']['name']} ({context['communication']['sender']['role']})
-Priority: {context['communication']['priority']}/5
-Type: {context['communication']['type']}
-Content: {context['communication']['content']}
----
-
-Context:
-- Your relationship with sender: {context['communication']['sender']['relationship_score']:.1f}/1.0
-- Your current workload: {context['agent']['workload']['utilization']:.1f}x capacity
-- Your stress level: {context['agent']['stress_level']:.1f}/1.0
-- Your current state: {context['agent']['current_state']}
-
-Based on your personality, role, and current situation, how would you respond?
-
-Provide your response in JSON format:
-{{
-    "response_type": "take_action|ignore|seek_clarification|provide_feedback|escalate|delegate",
-    "content": "Your actual response message",
-    "reasoning": "Why you chose this response",
-    "sentiment": 0.5,  // -1 (negative) to 1 (positive)
-    "confidence": 0.8,  // 0 to 1
-    "action_taken": true,  // Will you actually do something?
-    "estimated_hours": 4  // If action_taken, how many hours to complete?
-}}
-"""
+        communication_context = context["communication"]
+        sender = communication_context["sender"]
+        agent_context = context["agent"]
+        reasoning_prompt = REASONING_PROMPT_TEMPLATE % (
+            persona_prompt,
+            sender["name"],
+            sender["role"],
+            communication_context["priority"],
+            communication_context["type"],
+            communication_context["content"],
+            sender["relationship_score"],
+            agent_context["workload"]["utilization"],
+            agent_context["stress_level"],
+            agent_context["current_state"],
+        )
         
+        # The prompt renders everything the model sees, so an identical prompt
+        # (same persona, state and communication) can reuse the earlier answer
+        cache_key = hashlib.blake2b(reasoning_prompt.encode(), digest_size=16).digest()
+        cached = self._response_cache.get(cache_key)
+        if cached is not None:
+            self._response_cache.move_to_end(cache_key)
+            return dict(cached)
+        
+        model = self.model_router(context["communication"]["priority"])
         try:
             # Use MCP chat completion
             ai_response = await self.mcp_client.use_tool("chat_completion", {
@@ -170,82 +297,79 @@ Provide your response in JSON format:
                     {"role": "system", "content": "You are simulating a realistic employee response to workplace communication."},
                     {"role": "user", "content": reasoning_prompt}
                 ],
-                "model": "gpt-4",
+                "model": model,
                 "temperature": 0.7,  # Some randomness for realistic variation
                 "max_tokens": 500
             })
             
             # Parse JSON response
             response_text = ai_response.get("content", "")
-            return json.loads(response_text)
+            parsed = _json_loads(response_text)
             
         except Exception as e:
             logger.error(f"AI response generation failed: {e}")
             return None
+        
+        if not isinstance(parsed, dict):
+            logger.error(f"AI response was not a JSON object: {type(parsed).__name__}")
+            return None
+        
+        # Fill in omitted fields once so downstream code can index directly, and
+        # record which model answered (the prompt fixes the priority, so cache hits agree)
+        response = {**AI_RESPONSE_DEFAULTS, **parsed, "model_used": model}
+        if self.response_cache_size > 0:
+            self._response_cache[cache_key] = dict(response)
+            if len(self._response_cache) > self.response_cache_size:
+                self._response_cache.popitem(last=False)
+        return response
     
-    def _create_persona_prompt(self, agent_info: Dict[str, Any]) -> str:
-        """Create a detailed persona prompt for the AI."""
+    def _persona(self, agent: SimulationAgent) -> Dict[str, str]:
+        """Get the cached personality description and static persona prompt header.
         
-        return f"""
-You are {agent_info['name']}, a {agent_info['role']} in the {agent_info['department']} department.
+        Entries are rebuilt when the agent's name, role, department or seniority change.
+        """
+        professional = agent.professional
+        identity = (agent.name, professional.role, professional.department, professional.seniority_level)
+        persona = self.agent_contexts.get(agent.id)
+        if persona is not None and persona["identity"] == identity:
+            return persona
+        
+        personality_desc = self._describe_personality(agent.personality)
+        header = f"""
+You are {agent.name}, a {professional.role} in the {professional.department} department.
 
 Your personality:
-{agent_info['personality']}
+{personality_desc}
 
 Your professional context:
-- Seniority level: {agent_info['seniority_level']}/5
-- Expertise: {', '.join(agent_info['expertise_areas'])}
-- Current workload: {agent_info['workload']['utilization']:.1f}x your normal capacity
-- Stress level: {agent_info['stress_level']:.1f}/1.0 (where 1.0 is maximum stress)
-
-You should respond authentically as this person would, considering:
-- Your personality traits and communication style
-- Your current workload and stress level
-- Your role and responsibilities
-- Your relationship with the person contacting you
-- The priority and type of communication
+- Seniority level: {professional.seniority_level}/5
+- Expertise: {', '.join(professional.expertise_areas)}
 """
+        persona = {"identity": identity, "personality": personality_desc, "header": header}
+        self.agent_contexts[agent.id] = persona
+        return persona
+    
+    def _create_persona_prompt(self, agent: SimulationAgent, agent_info: Dict[str, Any]) -> str:
+        """Create a detailed persona prompt for the AI."""
+        
+        # Only workload and stress change from one communication to the next
+        return (
+            self._persona(agent)["header"]
+            + f"- Current workload: {agent_info['workload']['utilization']:.1f}x your normal capacity\n"
+            + f"- Stress level: {agent_info['stress_level']:.1f}/1.0 (where 1.0 is maximum stress)\n"
+            + PERSONA_GUIDANCE
+        )
     
     def _describe_personality(self, personality) -> str:
         """Convert personality traits to natural language description."""
         
         traits = []
-        
-        risk_tolerance = personality.get_trait(PersonalityTrait.RISK_TOLERANCE)
-        if risk_tolerance > 0.7:
-            traits.append("You're comfortable taking risks and trying new approaches")
-        elif risk_tolerance < 0.3:
-            traits.append("You prefer proven methods and are cautious about risks")
-        
-        authority_response = personality.get_trait(PersonalityTrait.AUTHORITY_RESPONSE)
-        if authority_response > 0.7:
-            traits.append("You generally follow directions from leadership")
-        elif authority_response < 0.3:
-            traits.append("You tend to question authority and think independently")
-        
-        communication_style = personality.get_trait(PersonalityTrait.COMMUNICATION_STYLE)
-        if communication_style > 0.7:
-            traits.append("You communicate directly and assertively")
-        elif communication_style < 0.3:
-            traits.append("You prefer diplomatic and tactful communication")
-        
-        change_adaptability = personality.get_trait(PersonalityTrait.CHANGE_ADAPTABILITY)
-        if change_adaptability > 0.7:
-            traits.append("You adapt quickly to changes and new situations")
-        elif change_adaptability < 0.3:
-            traits.append("You prefer stability and are resistant to change")
-        
-        workload_sensitivity = personality.get_trait(PersonalityTrait.WORKLOAD_SENSITIVITY)
-        if workload_sensitivity > 0.7:
-            traits.append("You become stressed easily when workload increases")
-        elif workload_sensitivity < 0.3:
-            traits.append("You handle high workloads well without much stress")
-        
-        collaboration_preference = personality.get_trait(PersonalityTrait.COLLABORATION_PREFERENCE)
-        if collaboration_preference > 0.7:
-            traits.append("You enjoy working with others and value teamwork")
-        elif collaboration_preference < 0.3:
-            traits.append("You prefer working independently")
+        for trait, high, low in PERSONALITY_DESCRIPTIONS:
+            value = personality.get_trait(trait)
+            if value > 0.7:
+                traits.append(high)
+            elif value < 0.3:
+                traits.append(low)
         
         return "- " + "\n- ".join(traits)
     
@@ -255,42 +379,30 @@ You should respond authentically as this person would, considering:
         communication: PriorityCommunication,
         ai_response: Dict[str, Any]
     ) -> AgentResponse:
-        """Convert AI response to structured AgentResponse."""
+        """Convert an AI response, as completed by _get_ai_response, to an AgentResponse."""
         
         # Map response type string to enum
-        response_type_map = {
-            "take_action": ResponseType.TAKE_ACTION,
-            "ignore": ResponseType.IGNORE,
-            "seek_clarification": ResponseType.SEEK_CLARIFICATION,
-            "provide_feedback": ResponseType.PROVIDE_FEEDBACK,
-            "escalate": ResponseType.ESCALATE,
-            "delegate": ResponseType.DELEGATE,
-        }
-        
-        response_type = response_type_map.get(
-            ai_response.get("response_type", "ignore"),
-            ResponseType.IGNORE
-        )
+        response_type = AI_RESPONSE_TYPES.get(ai_response["response_type"], ResponseType.IGNORE)
         
         # Calculate completion time if action is taken
         completion_time = None
-        if ai_response.get("action_taken", False) and ai_response.get("estimated_hours"):
-            from datetime import timedelta
+        if ai_response["action_taken"] and ai_response["estimated_hours"]:
             completion_time = datetime.now() + timedelta(hours=ai_response["estimated_hours"])
         
         return AgentResponse(
             agent_id=agent.id,
             communication_id=communication.id,
             response_type=response_type,
-            content=ai_response.get("content", ""),
-            sentiment=float(ai_response.get("sentiment", 0.0)),
-            confidence=float(ai_response.get("confidence", 0.5)),
-            action_taken=ai_response.get("action_taken", False),
+            content=ai_response["content"],
+            sentiment=float(ai_response["sentiment"]),
+            confidence=float(ai_response["confidence"]),
+            action_taken=ai_response["action_taken"],
             estimated_completion_time=completion_time,
             metadata={
-                "ai_reasoning": ai_response.get("reasoning", ""),
+                "ai_reasoning": ai_response["reasoning"],
+                "stress_delta": ai_response["stress_delta"],
                 "ai_generated": True,
-                "model_used": "gpt-4"
+                "model_used": ai_response["model_used"]
             }
         )
     
@@ -302,58 +414,53 @@ You should respond authentically as this person would, considering:
     ) -> None:
         """Update agent state with AI-generated insights."""
         
+        now = datetime.now()
+        
         # Standard updates (same as rule-based system)
-        interaction = {
-            "timestamp": datetime.now().isoformat(),
-            "communication_id": communication.id,
-            "sender_id": communication.sender_id,
-            "response_type": response.response_type.value,
-            "sentiment": response.sentiment,
-            "ai_generated": True,
-            "reasoning": response.metadata.get("ai_reasoning", "")
-        }
-        agent.memory.interaction_history.append(interaction)
+        agent.memory.interaction_history.record(
+            communication.id,
+            communication.sender_id,
+            response.response_type,
+            response.sentiment,
+            timestamp=now.timestamp(),
+            details={
+                "ai_generated": True,
+                "reasoning": response.metadata.get("ai_reasoning", "")
+            },
+        )
         
         # AI-enhanced updates
-        if response.response_type == ResponseType.TAKE_ACTION:
+        is_action = response.response_type is ResponseType.TAKE_ACTION
+        if is_action:
             # AI can provide more nuanced workload estimates
             estimated_hours = response.metadata.get("estimated_hours", 4)
             workload_increase = estimated_hours / 40  # Convert hours to workload units
             agent.professional.current_workload += workload_increase
         
-        # Use AI to assess stress impact more realistically
+        # The main response call also scores the stress impact, so no second
+        # completion is needed
         try:
-            stress_assessment = await self.mcp_client.use_tool("chat_completion", {
-                "messages": [{
-                    "role": "user",
-                    "content": f"""
-                    An employee with stress level {agent.memory.stress_level:.2f} just {response.response_type.value} 
-                    to a priority {communication.priority_level} communication. 
-                    How should their stress level change? Respond with just a number between -0.1 and 0.2.
-                    """
-                }],
-                "model": "gpt-3.5-turbo",
-                "temperature": 0.3,
-                "max_tokens": 10
-            })
-            
-            stress_change = float(stress_assessment.get("content", "0.05"))
+            stress_change = max(-0.1, min(0.2, float(response.metadata["stress_delta"])))
             agent.memory.stress_level = max(0.0, min(1.0, agent.memory.stress_level + stress_change))
             
-        except Exception as e:
-            logger.warning(f"AI stress assessment failed, using default: {e}")
+        except (KeyError, TypeError, ValueError):
+            logger.warning("AI response had no usable stress_delta, using default")
             # Fallback to rule-based stress update
-            if response.response_type == ResponseType.TAKE_ACTION:
+            if is_action:
                 agent.memory.stress_level += 0.1
         
-        agent.memory.last_updated = datetime.now()
+        agent.memory.last_updated = now
     
     async def generate_proactive_communication(
         self,
         agent: SimulationAgent,
-        all_agents: Dict[str, SimulationAgent]
+        all_agents: Dict[str, SimulationAgent],
+        peer_index: Optional[Dict[Tuple[str, int], List[str]]] = None
     ) -> Optional[PriorityCommunication]:
-        """Use AI to generate proactive communications from agents."""
+        """Use AI to generate proactive communications from agents.
+        
+        peer_index is a build_peer_index result for all_agents; it is built on demand if omitted.
+        """
         
         context = {
             "agent": agent.to_dict(),
@@ -392,13 +499,15 @@ You should respond authentically as this person would, considering:
                 "max_tokens": 300
             })
             
-            response_data = json.loads(ai_response.get("content", "{}"))
+            response_data = _json_loads(ai_response.get("content", "{}"))
             
             if not response_data.get("should_communicate", False):
                 return None
             
             # Find appropriate recipient
-            recipient_id = self._find_recipient(agent, response_data["recipient_role"], all_agents)
+            recipient_id = self._find_recipient(
+                agent, response_data["recipient_role"], all_agents, peer_index
+            )
             if not recipient_id:
                 return None
             
@@ -433,25 +542,24 @@ You should respond authentically as this person would, considering:
         self,
         agent: SimulationAgent,
         recipient_role: str,
-        all_agents: Dict[str, SimulationAgent]
+        all_agents: Dict[str, SimulationAgent],
+        peer_index: Optional[Dict[Tuple[str, int], List[str]]] = None
     ) -> Optional[str]:
         """Find appropriate recipient based on role relationship."""
         
         if recipient_role == "manager" and agent.professional.manager_id:
             return agent.professional.manager_id
         elif recipient_role == "direct_report" and agent.professional.direct_reports:
-            import random
-            return random.choice(agent.professional.direct_reports)
+            return self.rng.choice(agent.professional.direct_reports)
         elif recipient_role == "peer":
-            # Find peer in same department
-            peers = [
-                other_agent.id for other_agent in all_agents.values()
-                if (other_agent.professional.department == agent.professional.department and
-                    other_agent.id != agent.id and
-                    other_agent.professional.seniority_level == agent.professional.seniority_level)
-            ]
+            # Find peer in same department and seniority
+            if peer_index is None:
+                peer_index = build_peer_index(all_agents)
+            group = peer_index.get(
+                (agent.professional.department, agent.professional.seniority_level), []
+            )
+            peers = [agent_id for agent_id in group if agent_id != agent.id]
             if peers:
-                import random
-                return random.choice(peers)
+                return self.rng.choice(peers)
         
         return None
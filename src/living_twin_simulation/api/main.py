@@ -10,18 +10,20 @@ FastAPI application providing access to the Living Twin system:
 
 from fastapi import FastAPI, HTTPException, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse, Response
 from pydantic import BaseModel, Field
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 import asyncio
 import logging
+import orjson
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta
 
 from ..simulation.simulation_engine import SimulationEngine
 from ..domain.models import (
     OrganizationalMember, CommunicationType, ResponseType, StrategicPriority,
     IntelligenceAgentType, MarketIntelligenceAgent, CatchballAgent, 
-    WisdomAgent, TruthAgent, GossipAgent, OrganizationalTwin
+    WisdomAgent, TruthAgent, GossipAgent, OrganizationalTwin, PersonalityTrait, SimulationAgent
 )
 from ..config.loader import ConfigurationLoader, create_agent_from_config, convert_employee_list_to_dict
 
@@ -29,8 +31,16 @@ from ..config.loader import ConfigurationLoader, create_agent_from_config, conve
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Load the default organization and warm the config caches before serving requests."""
+    await startup_event()
+    await preload_organizations()
+    yield
+
 # Create FastAPI app with OpenAPI metadata
 app = FastAPI(
+    lifespan=lifespan,
     title="Living Twin Organizational Intelligence API",
     description="""
     The Living Twin API enables organizational intelligence and strategic alignment.
@@ -56,6 +66,7 @@ app = FastAPI(
     into organizational alignment. It stops before operational details and daily tasks.
     """,
     version="1.0.0",
+    default_response_class=ORJSONResponse,  # orjson serializes models and datetimes natively
     contact={
         "name": "Living Twin Simulation",
         "url": "https://github.com/kpernyer/living-twin-simulation",
@@ -201,6 +212,13 @@ class StrategicCommunicationRequest(BaseModel):
             }
         }
 
+class CommunicationResponseItem(BaseModel):
+    agent_id: str
+    response_type: ResponseType
+    content: str
+    sentiment: float
+    created_at: datetime
+
 class CommunicationResponse(BaseModel):
     id: str
     sender_id: str
@@ -208,7 +226,7 @@ class CommunicationResponse(BaseModel):
     communication_type: CommunicationType
     content: str
     timestamp: datetime
-    responses: List[Dict[str, Any]] = []
+    responses: List[CommunicationResponseItem] = []
     status: str
     
     class Config:
@@ -237,6 +255,14 @@ class SimulationParameters(BaseModel):
     stress_threshold: float = 0.8
     collaboration_bonus: float = 0.2
 
+class StrategicGoal(BaseModel):
+    id: str
+    title: str
+    description: str = ""
+    priority: str = "medium"
+    target_date: Optional[str] = None
+    success_metrics: List[str] = []
+
 class OrganizationInfo(BaseModel):
     id: str
     name: str
@@ -244,20 +270,112 @@ class OrganizationInfo(BaseModel):
     size: str
     description: str
     employee_count: int
-    strategic_goals: List[Dict[str, Any]] = []
+    strategic_goals: List[StrategicGoal] = []
 
 # Global simulation engine and configuration instances
 simulation_engine: Optional[SimulationEngine] = None
 config_loader = ConfigurationLoader()
 current_organization = None
 
-@app.on_event("startup")
+# Alignment is not tracked per member yet, so listings report a neutral score
+DEFAULT_ALIGNMENT_SCORE = 0.5
+
+def _member_from_config(employee_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Build a member payload (OrganizationalMemberResponse fields) from our own YAML configuration."""
+    return {
+        "id": employee_data['id'],
+        "name": employee_data['name'],
+        "role": employee_data['role'],
+        "department": employee_data['department'],
+        "level": employee_data['level'],
+        "personality_traits": list(employee_data.get('personality_traits', {})),
+        "workload": employee_data.get('professional_profile', {}).get('current_workload', 0.5),
+        "satisfaction": 0.8,  # Default satisfaction for non-simulation employees
+        "strategic_alignment_score": DEFAULT_ALIGNMENT_SCORE,
+    }
+
+# Placeholder members served by the department listing, built once at import
+MOCK_DEPARTMENT_MEMBERS = (
+    OrganizationalMemberResponse.model_construct(
+        id="ceo_001",
+        name="CEO",
+        role="Chief Executive Officer",
+        department="Executive",
+        level="C-Level",
+        personality_traits=["risk_tolerance", "authority_response"],
+        workload=0.8,
+        satisfaction=0.9,
+        strategic_alignment_score=DEFAULT_ALIGNMENT_SCORE
+    ),
+    OrganizationalMemberResponse.model_construct(
+        id="cto_001",
+        name="CTO",
+        role="Chief Technology Officer",
+        department="Technology",
+        level="C-Level",
+        personality_traits=["change_adaptability", "communication_style"],
+        workload=0.7,
+        satisfaction=0.8,
+        strategic_alignment_score=DEFAULT_ALIGNMENT_SCORE
+    ),
+)
+
+def _index_by_department(
+    members: Tuple[OrganizationalMemberResponse, ...]
+) -> Dict[str, List[OrganizationalMemberResponse]]:
+    """Group members by lowercased department name."""
+    index: Dict[str, List[OrganizationalMemberResponse]] = {}
+    for member in members:
+        index.setdefault(member.department.lower(), []).append(member)
+    return index
+
+MOCK_MEMBERS_BY_DEPARTMENT = _index_by_department(MOCK_DEPARTMENT_MEMBERS)
+
+# Every agent carries the full personality profile, so all list the same traits
+PERSONALITY_TRAIT_NAMES = [trait.value for trait in PersonalityTrait]
+
+def _member_from_agent(agent: SimulationAgent) -> Dict[str, Any]:
+    """Build a member payload (OrganizationalMemberResponse fields) from a simulation agent."""
+    professional = agent.professional
+    return {
+        "id": agent.id,
+        "name": agent.name,
+        "role": professional.role,
+        "department": professional.department,
+        "level": f"Level {professional.seniority_level}",
+        "personality_traits": PERSONALITY_TRAIT_NAMES,
+        "workload": professional.current_workload,
+        "satisfaction": 1.0 - agent.memory.stress_level,  # Convert stress to satisfaction
+        "strategic_alignment_score": DEFAULT_ALIGNMENT_SCORE,
+    }
+
+# Serialized member listings per organization, reused while its parsed config is unchanged
+_members_json_cache: Dict[str, Tuple[Dict[str, Any], bytes]] = {}
+
+def _config_members_response(org_id: str, config: Dict[str, Any]) -> Response:
+    """Serve an organization's configured members, serializing them once per config load."""
+    cached = _members_json_cache.get(org_id)
+    if cached is None or cached[0] is not config:
+        employees = []
+        for employee_data in config_loader.load_employees_from_config(config):
+            try:
+                # Convert employee data to response format
+                employees.append(_member_from_config(employee_data))
+            except Exception as emp_error:
+                logger.error(f"Error processing employee {employee_data.get('id', 'unknown')}: {emp_error}")
+                continue
+        
+        logger.info(f"Serialized {len(employees)} employees from organization {org_id}")
+        cached = (config, orjson.dumps(employees))
+        _members_json_cache[org_id] = cached
+    return Response(content=cached[1], media_type="application/json")
+
 async def startup_event():
     """Initialize the simulation engine on startup."""
     global simulation_engine, config_loader
     try:
         # Load default organization (acme_corp)
-        config = config_loader.load_organization("acme_corp")
+        config = await asyncio.to_thread(config_loader.load_organization, "acme_corp")
         employees_list = config_loader.load_employees_from_config(config)
         
         # Create agents directly from configuration
@@ -280,6 +398,15 @@ async def startup_event():
         logger.error(f"Failed to initialize simulation engine: {e}")
         # Continue without simulation engine for now
 
+async def preload_organizations():
+    """Parse every organization config and prebuild its member listing."""
+    for org_id in await asyncio.to_thread(config_loader.get_available_organizations):
+        try:
+            config = await asyncio.to_thread(config_loader.load_organization, org_id)
+            _config_members_response(org_id, config)
+        except Exception as e:
+            logger.warning(f"Failed to preload organization {org_id}: {e}")
+
 @app.get("/", tags=["Root"])
 async def root():
     """Root endpoint with API information."""
@@ -293,13 +420,18 @@ async def root():
 @app.get("/health", tags=["Health"])
 async def health_check():
     """Health check endpoint for Docker health checks."""
-    return {
+    # Probes hit this constantly, so encode directly and skip the response pipeline
+    return Response(content=orjson.dumps({
         "status": "healthy",
         "timestamp": datetime.now(),
         "simulation_engine": simulation_engine is not None
-    }
+    }), media_type="application/json")
 
-@app.get("/organizational-members", response_model=List[OrganizationalMemberResponse], tags=["Organizational Members"])
+@app.get(
+    "/organizational-members",
+    responses={200: {"model": List[OrganizationalMemberResponse]}},
+    tags=["Organizational Members"],
+)
 async def get_organizational_members(organization_id: Optional[str] = None):
     """
     Get all organizational members in the Living Twin system.
@@ -316,30 +448,8 @@ async def get_organizational_members(organization_id: Optional[str] = None):
         # If organization_id is provided, load that organization's employees
         if organization_id:
             try:
-                config = config_loader.load_organization(organization_id)
-                employees_list = config_loader.load_employees_from_config(config)
-                
-                employees = []
-                for employee_data in employees_list:
-                    try:
-                        # Convert employee data to response format
-                        employee = EmployeeResponse(
-                            id=employee_data['id'],
-                            name=employee_data['name'],
-                            role=employee_data['role'],
-                            department=employee_data['department'],
-                            level=employee_data['level'],
-                            personality_traits=list(employee_data.get('personality_traits', {}).keys()),
-                            workload=employee_data.get('professional_profile', {}).get('current_workload', 0.5),
-                            satisfaction=0.8  # Default satisfaction for non-simulation employees
-                        )
-                        employees.append(employee)
-                    except Exception as emp_error:
-                        logger.error(f"Error processing employee {employee_data.get('id', 'unknown')}: {emp_error}")
-                        continue
-                
-                logger.info(f"Returning {len(employees)} employees from organization {organization_id}")
-                return employees
+                config = await asyncio.to_thread(config_loader.load_organization, organization_id)
+                return _config_members_response(organization_id, config)
                 
             except FileNotFoundError:
                 raise HTTPException(status_code=404, detail=f"Organization {organization_id} not found")
@@ -347,35 +457,19 @@ async def get_organizational_members(organization_id: Optional[str] = None):
         # Otherwise, return employees from current simulation
         agents = simulation_engine.state.agents
         
-        # Debug logging
-        logger.info(f"Number of agents: {len(agents)}")
-        logger.info(f"Agent IDs: {list(agents.keys())}")
-        
         employees = []
         for agent_id, agent in agents.items():
             try:
                 # Convert agent to employee response format
-                employee = EmployeeResponse(
-                    id=agent.id,
-                    name=agent.name,
-                    role=agent.professional.role,
-                    department=agent.professional.department,
-                    level=f"Level {agent.professional.seniority_level}",
-                    personality_traits=list(agent.personality.traits.keys()),
-                    workload=agent.professional.current_workload,
-                    satisfaction=1.0 - agent.memory.stress_level  # Convert stress to satisfaction
-                )
-                employees.append(employee)
+                employees.append(_member_from_agent(agent))
             except Exception as agent_error:
                 logger.error(f"Error processing agent {agent_id}: {agent_error}")
                 continue
         
-        logger.info(f"Returning {len(employees)} employees from current simulation")
-        return employees
-    except Exception as e:
-        logger.error(f"Error fetching employees: {e}")
-        import traceback
-        logger.error(f"Traceback: {traceback.format_exc()}")
+        logger.debug("Returning %d employees from current simulation", len(employees))
+        return Response(content=orjson.dumps(employees), media_type="application/json")
+    except Exception:
+        logger.exception("Error fetching employees")
         raise HTTPException(status_code=500, detail="Failed to fetch employees")
 
 @app.get("/organizations", response_model=List[str], tags=["Organizations"])
@@ -386,7 +480,7 @@ async def get_available_organizations():
     Returns a list of organization IDs that can be loaded.
     """
     try:
-        return config_loader.get_available_organizations()
+        return await asyncio.to_thread(config_loader.get_available_organizations)
     except Exception as e:
         logger.error(f"Error fetching organizations: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch organizations")
@@ -402,7 +496,7 @@ async def get_organization_info(org_id: str):
     Returns organization details including employee count and strategic goals.
     """
     try:
-        config = config_loader.load_organization(org_id)
+        config = await asyncio.to_thread(config_loader.load_organization, org_id)
         employees = config_loader.load_employees_from_config(config)
         strategic_goals = config_loader.load_strategic_goals(config)
         
@@ -421,7 +515,11 @@ async def get_organization_info(org_id: str):
         logger.error(f"Error fetching organization info: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch organization info")
 
-@app.get("/organizations/{org_id}/members", response_model=List[OrganizationalMemberResponse], tags=["Organizational Members"])
+@app.get(
+    "/organizations/{org_id}/members",
+    responses={200: {"model": List[OrganizationalMemberResponse]}},
+    tags=["Organizational Members"],
+)
 async def get_members_by_organization(org_id: str):
     """
     Get all organizational members for a specific organization.
@@ -432,29 +530,8 @@ async def get_members_by_organization(org_id: str):
     Returns a list of all organizational members in the specified organization.
     """
     try:
-        config = config_loader.load_organization(org_id)
-        employees_list = config_loader.load_employees_from_config(config)
-        
-        employees = []
-        for employee_data in employees_list:
-            try:
-                # Convert employee data to response format
-                employee = EmployeeResponse(
-                    id=employee_data['id'],
-                    name=employee_data['name'],
-                    role=employee_data['role'],
-                    department=employee_data['department'],
-                    level=employee_data['level'],
-                    personality_traits=list(employee_data.get('personality_traits', {}).keys()),
-                    workload=employee_data.get('professional_profile', {}).get('current_workload', 0.5),
-                    satisfaction=0.8  # Default satisfaction for non-simulation employees
-                )
-                employees.append(employee)
-            except Exception as emp_error:
-                logger.error(f"Error processing employee {employee_data.get('id', 'unknown')}: {emp_error}")
-                continue
-        
-        return employees
+        config = await asyncio.to_thread(config_loader.load_organization, org_id)
+        return _config_members_response(org_id, config)
         
     except FileNotFoundError:
         raise HTTPException(status_code=404, detail=f"Organization {org_id} not found")
@@ -477,30 +554,7 @@ async def get_members_by_department(department: str):
     
     try:
         # Return mock data filtered by department
-        all_employees = [
-            EmployeeResponse(
-                id="ceo_001",
-                name="CEO",
-                role="Chief Executive Officer",
-                department="Executive",
-                level="C-Level",
-                personality_traits=["risk_tolerance", "authority_response"],
-                workload=0.8,
-                satisfaction=0.9
-            ),
-            EmployeeResponse(
-                id="cto_001",
-                name="CTO",
-                role="Chief Technology Officer",
-                department="Technology",
-                level="C-Level",
-                personality_traits=["change_adaptability", "communication_style"],
-                workload=0.7,
-                satisfaction=0.8
-            )
-        ]
-        filtered_employees = [emp for emp in all_employees if emp.department.lower() == department.lower()]
-        return filtered_employees
+        return MOCK_MEMBERS_BY_DEPARTMENT.get(department.lower(), [])
     except Exception as e:
         logger.error(f"Error fetching employees by department: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch employees")
@@ -603,7 +657,7 @@ async def start_simulation(org_id: str, parameters: Optional[SimulationParameter
     
     try:
         # Load organization configuration
-        config = config_loader.load_organization(org_id)
+        config = await asyncio.to_thread(config_loader.load_organization, org_id)
         employees_list = config_loader.load_employees_from_config(config)
         employees_data = convert_employee_list_to_dict(employees_list)
         
@@ -4,7 +4,7 @@ Configuration loader for organization data and simulation parameters.
 
 import yaml
 import os
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple
 from pathlib import Path
 
 from ..domain.models import SimulationAgent, PersonalityProfile, ProfessionalProfile
@@ -15,25 +15,50 @@ class ConfigurationLoader:
     
     def __init__(self, config_dir: str = "config/organizations"):
         self.config_dir = Path(config_dir)
+        self._organizations: Dict[str, Tuple[int, Dict[str, Any]]] = {}  # org_id -> (mtime_ns, config)
+        self._organization_ids: Tuple[int, List[str]] = (-1, [])  # (directory mtime_ns, org ids)
     
     def load_organization(self, org_id: str) -> Dict[str, Any]:
-        """Load organization configuration from YAML file."""
+        """Load organization configuration from YAML file.
+        
+        Parsed configurations are cached until the file's modification time changes,
+        so callers must treat the returned dict as read-only.
+        """
         config_file = self.config_dir / f"{org_id}.yaml"
         
-        if not config_file.exists():
+        try:
+            mtime_ns = config_file.stat().st_mtime_ns
+        except FileNotFoundError:
+            self._organizations.pop(org_id, None)
             raise FileNotFoundError(f"Configuration file not found: {config_file}")
         
+        cached = self._organizations.get(org_id)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+        
         with open(config_file, 'r') as f:
             config = yaml.safe_load(f)
         
+        self._organizations[org_id] = (mtime_ns, config)
         return config
     
     def get_available_organizations(self) -> List[str]:
-        """Get list of available organization configurations."""
-        orgs = []
-        for file in self.config_dir.glob("*.yaml"):
-            orgs.append(file.stem)
-        return orgs
+        """Get list of available organization configurations.
+        
+        The listing is reused until the directory's modification time changes,
+        which happens whenever a file is added, removed or renamed.
+        """
+        try:
+            mtime_ns = self.config_dir.stat().st_mtime_ns
+        except FileNotFoundError:
+            return []
+        
+        if self._organization_ids[0] != mtime_ns:
+            orgs = []
+            for file in self.config_dir.glob("*.yaml"):
+                orgs.append(file.stem)
+            self._organization_ids = (mtime_ns, orgs)
+        return list(self._organization_ids[1])
     
     def load_employees_from_config(self, config: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Extract employee data from configuration."""
@@ -61,8 +86,8 @@ def create_agent_from_config(employee_data: Dict[str, Any]) -> SimulationAgent:
         department=prof_data.get('department', ''),
         role=prof_data.get('role', ''),
         seniority_level=prof_data.get('seniority_level', 1),
-        expertise_areas=prof_data.get('expertise_areas', []),
-        direct_reports=prof_data.get('direct_reports', []),
+        expertise_areas=list(prof_data.get('expertise_areas', [])),  # Copies, the config is cached
+        direct_reports=list(prof_data.get('direct_reports', [])),
         manager_id=prof_data.get('manager_id'),
         workload_capacity=prof_data.get('workload_capacity', 1.0),
         current_workload=prof_data.get('current_workload', 0.5)
@@ -9,10 +9,13 @@ Terminology:
 - Organizational Members: People within the organization (formerly 'agents')
 """
 
+from array import array
+from collections.abc import MutableMapping, Sequence as SequenceABC
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Dict, List, Optional, Any
+from time import time
+from typing import Dict, Iterator, List, Optional, Any, Sequence, Union
 from uuid import uuid4
 
 
@@ -45,6 +48,20 @@ class ResponseType(Enum):
     DELEGATE = "delegate"
 
 
+# Response weights are plain lists in ResponseType order; these are the positions
+RESPONSE_TYPES = tuple(ResponseType)
+# Wire values per response type, looked up instead of via Enum.value per response
+RESPONSE_TYPE_VALUES = {response_type: response_type.value for response_type in RESPONSE_TYPES}
+(
+    IGNORE_INDEX,
+    TAKE_ACTION_INDEX,
+    SEEK_CLARIFICATION_INDEX,
+    PROVIDE_WISDOM_INDEX,
+    ESCALATE_INDEX,
+    DELEGATE_INDEX,
+) = range(len(RESPONSE_TYPES))
+
+
 class OrganizationalMemberState(Enum):
     """Current state of an organizational member in the Living Twin system."""
     AVAILABLE = "available"
@@ -72,22 +89,52 @@ class StrategicPriority(Enum):
     CRITICAL = "critical"
 
 
-@dataclass
+# (trait, slot name) pairs, resolved once instead of via Enum.value per access
+_TRAIT_SLOTS = tuple((trait, trait.value) for trait in PersonalityTrait)
+_TRAIT_SLOT_NAMES = dict(_TRAIT_SLOTS)
+
+
 class PersonalityProfile:
-    """Personality profile defining agent behavior patterns."""
-    traits: Dict[PersonalityTrait, float] = field(default_factory=dict)
-    
-    def __post_init__(self) -> None:
-        # Ensure all traits have values between 0.0 and 1.0
-        for trait in PersonalityTrait:
-            if trait not in self.traits:
-                self.traits[trait] = 0.5  # Default to neutral
-            else:
-                self.traits[trait] = max(0.0, min(1.0, self.traits[trait]))
+    """Personality profile defining agent behavior patterns.
+    
+    Every agent carries a full profile, so each trait is stored in its own slot
+    (named after the trait value, e.g. ``risk_tolerance``) instead of a per-agent
+    dict. ``traits`` still returns the dict view for callers that want one.
+    """
+    __slots__ = tuple(trait.value for trait in PersonalityTrait)
+    
+    def __init__(self, traits: Optional[Dict[Any, float]] = None) -> None:
+        traits = traits or {}
+        # Ensure all traits have values between 0.0 and 1.0; accept trait enums or
+        # their string values (as found in configuration files)
+        for trait, name in _TRAIT_SLOTS:
+            value = traits.get(trait, traits.get(name, 0.5))  # Default to neutral
+            setattr(self, name, max(0.0, min(1.0, value)))
+    
+    @classmethod
+    def from_values(cls, values: Sequence[float]) -> "PersonalityProfile":
+        """Build a profile from values already within 0.0-1.0, in PersonalityTrait order."""
+        profile = cls.__new__(cls)
+        for name, value in zip(cls.__slots__, values):
+            setattr(profile, name, value)
+        return profile
+    
+    @property
+    def traits(self) -> Dict[PersonalityTrait, float]:
+        """All trait values keyed by trait."""
+        return {trait: getattr(self, name) for trait, name in _TRAIT_SLOTS}
     
     def get_trait(self, trait: PersonalityTrait) -> float:
         """Get a personality trait value."""
-        return self.traits.get(trait, 0.5)
+        return getattr(self, _TRAIT_SLOT_NAMES.get(trait, ""), 0.5)
+    
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PersonalityProfile):
+            return NotImplemented
+        return self.traits == other.traits
+    
+    def __repr__(self) -> str:
+        return f"PersonalityProfile(traits={self.traits!r})"
 
 
 @dataclass
@@ -96,19 +143,189 @@ class ProfessionalProfile:
     department: str
     role: str
     seniority_level: int  # 1 (junior) to 5 (executive)
-    expertise_areas: List[str] = field(default_factory=list)
+    expertise_areas: Sequence[str] = field(default_factory=list)
     direct_reports: List[str] = field(default_factory=list)  # Agent IDs
     manager_id: Optional[str] = None
     workload_capacity: float = 1.0  # Base capacity multiplier
     current_workload: float = 0.5  # Current workload as fraction of capacity
+    department_id: int = -1  # Per-organization department code, -1 until assigned
+
+
+class RelationshipScores(MutableMapping):
+    """Relationship strengths towards other members, keyed by agent id.
+    
+    Members of one organization share ``index`` (agent_id -> column) and each
+    keeps a flat ``array('d')`` row, which is far smaller than a dict of N-1
+    float objects. NaN marks a column with no score; ids outside the index are
+    kept in a small overflow dict.
+    """
+    __slots__ = ("index", "row", "extra")
+    
+    def __init__(self, index: Dict[str, int], row: Optional[array] = None) -> None:
+        self.index = index
+        self.row = row if row is not None else array("d", [float("nan")]) * len(index)
+        self.extra: Dict[str, float] = {}
+    
+    def __getitem__(self, agent_id: str) -> float:
+        column = self.index.get(agent_id)
+        if column is None:
+            return self.extra[agent_id]
+        value = self.row[column]
+        if value != value:  # NaN: no score for this member
+            raise KeyError(agent_id)
+        return value
+    
+    def get(self, agent_id: str, default: Any = None) -> Any:
+        # Read the row directly; Mapping.get would go through __getitem__ and
+        # raise and catch KeyError for every missing score
+        column = self.index.get(agent_id)
+        if column is None:
+            return self.extra.get(agent_id, default)
+        value = self.row[column]
+        return default if value != value else value
+    
+    def __setitem__(self, agent_id: str, score: float) -> None:
+        column = self.index.get(agent_id)
+        if column is None:
+            self.extra[agent_id] = score
+        else:
+            self.row[column] = score
+    
+    def __delitem__(self, agent_id: str) -> None:
+        column = self.index.get(agent_id)
+        if column is None:
+            del self.extra[agent_id]
+            return
+        if self.row[column] != self.row[column]:
+            raise KeyError(agent_id)
+        self.row[column] = float("nan")
+    
+    def __iter__(self) -> Iterator[str]:
+        row = self.row
+        for agent_id, column in self.index.items():
+            if row[column] == row[column]:
+                yield agent_id
+        yield from self.extra
+    
+    def __len__(self) -> int:
+        return sum(1 for score in self.row if score == score) + len(self.extra)
+    
+    def __repr__(self) -> str:
+        return f"RelationshipScores({dict(self.items())!r})"
+
+
+_RESPONSE_CODES = {response_type: code for code, response_type in enumerate(RESPONSE_TYPES)}
+_RESPONSE_VALUES = tuple(RESPONSE_TYPE_VALUES[response_type] for response_type in RESPONSE_TYPES)
+_INTERACTION_FIELDS = ("timestamp", "communication_id", "sender_id", "response_type", "sentiment")
+
+INTERACTION_HISTORY_CAPACITY = 1000
+
+
+class InteractionHistory(SequenceABC):
+    """Most recent interactions of a member, oldest first.
+    
+    Entries are kept column by column in a ring of at most ``capacity`` slots
+    (timestamps as epoch seconds, response types as small codes) instead of one
+    dict per interaction, so long simulations stay bounded in memory. Indexing
+    returns the familiar interaction dicts, built on demand.
+    """
+    __slots__ = ("capacity", "start", "timestamps", "communication_ids", "sender_ids",
+                 "response_codes", "sentiments", "details")
+    
+    def __init__(self, capacity: int = INTERACTION_HISTORY_CAPACITY) -> None:
+        self.capacity = capacity
+        self.start = 0  # Slot holding the oldest entry once the ring is full
+        self.timestamps = array("d")
+        self.communication_ids: List[str] = []
+        self.sender_ids: List[str] = []
+        self.response_codes = array("b")
+        self.sentiments = array("d")
+        self.details: List[Optional[Dict[str, Any]]] = []  # Any extra keys per entry
+    
+    def record(
+        self,
+        communication_id: str,
+        sender_id: str,
+        response_type: ResponseType,
+        sentiment: float,
+        timestamp: Optional[float] = None,
+        details: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Record an interaction, overwriting the oldest one when full."""
+        if timestamp is None:
+            timestamp = time()
+        code = _RESPONSE_CODES[response_type]
+        if len(self.timestamps) < self.capacity:
+            self.timestamps.append(timestamp)
+            self.communication_ids.append(communication_id)
+            self.sender_ids.append(sender_id)
+            self.response_codes.append(code)
+            self.sentiments.append(sentiment)
+            self.details.append(details)
+            return
+        slot = self.start
+        self.start = (slot + 1) % self.capacity
+        self.timestamps[slot] = timestamp
+        self.communication_ids[slot] = communication_id
+        self.sender_ids[slot] = sender_id
+        self.response_codes[slot] = code
+        self.sentiments[slot] = sentiment
+        self.details[slot] = details
+    
+    def append(self, interaction: Dict[str, Any]) -> None:
+        """Record an interaction given as a dict (ISO timestamp, response type value)."""
+        details = {key: value for key, value in interaction.items() if key not in _INTERACTION_FIELDS}
+        timestamp = interaction.get("timestamp")
+        self.record(
+            interaction["communication_id"],
+            interaction["sender_id"],
+            ResponseType(interaction["response_type"]),
+            interaction["sentiment"],
+            timestamp=datetime.fromisoformat(timestamp).timestamp() if timestamp else None,
+            details=details or None,
+        )
+    
+    def _entry(self, slot: int) -> Dict[str, Any]:
+        interaction = {
+            "timestamp": datetime.fromtimestamp(self.timestamps[slot]).isoformat(),
+            "communication_id": self.communication_ids[slot],
+            "sender_id": self.sender_ids[slot],
+            "response_type": _RESPONSE_VALUES[self.response_codes[slot]],
+            "sentiment": self.sentiments[slot],
+        }
+        details = self.details[slot]
+        if details:
+            interaction.update(details)
+        return interaction
+    
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        size = len(self.timestamps)
+        if isinstance(index, slice):
+            return [self._entry((self.start + i) % size) for i in range(*index.indices(size))]
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("interaction history index out of range")
+        return self._entry((self.start + index) % size)
+    
+    def __len__(self) -> int:
+        return len(self.timestamps)
+    
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, SequenceABC):
+            return NotImplemented
+        return list(self) == list(other)
+    
+    def __repr__(self) -> str:
+        return f"InteractionHistory({list(self)!r})"
 
 
 @dataclass
 class OrganizationalMemberMemory:
     """Organizational member's memory of past interactions and experiences in Living Twin."""
-    interaction_history: List[Dict[str, Any]] = field(default_factory=list)
+    interaction_history: InteractionHistory = field(default_factory=InteractionHistory)
     priority_responses: Dict[str, List[str]] = field(default_factory=dict)  # priority_id -> response_ids
-    relationship_scores: Dict[str, float] = field(default_factory=dict)  # agent_id -> relationship_strength
+    relationship_scores: MutableMapping = field(default_factory=dict)  # agent_id -> relationship_strength
     stress_level: float = 0.0  # 0.0 (calm) to 1.0 (highly stressed)
     last_updated: datetime = field(default_factory=datetime.now)
 
@@ -126,31 +343,43 @@ class OrganizationalMember:
     organization_id: str = ""
     created_at: datetime = field(default_factory=datetime.now)
     
-    def calculate_response_probability(self, communication: 'StrategicCommunication') -> Dict[ResponseType, float]:
-        """Calculate probability of different response types based on personality and context."""
-        probabilities = {}
+    def calculate_response_weights(self, communication: 'StrategicCommunication') -> List[float]:
+        """Calculate unnormalized response weights, in ResponseType order, based on personality and context."""
+        weights = [0.0] * len(RESPONSE_TYPES)
         
-        # Base probabilities influenced by personality traits
-        authority_response = self.personality.get_trait(PersonalityTrait.AUTHORITY_RESPONSE)
-        workload_sensitivity = self.personality.get_trait(PersonalityTrait.WORKLOAD_SENSITIVITY)
+        # Base weights influenced by personality traits
+        personality = self.personality
+        authority_response = personality.authority_response
+        workload_sensitivity = personality.workload_sensitivity
+        communication_type = communication.type
         
         # Adjust based on communication type
-        if communication.type == CommunicationType.ORDER:
-            probabilities[ResponseType.TAKE_ACTION] = 0.7 + (authority_response * 0.25)
-            probabilities[ResponseType.SEEK_CLARIFICATION] = 0.2 - (authority_response * 0.1)
-            probabilities[ResponseType.IGNORE] = 0.1 - (authority_response * 0.05)
-        elif communication.type == CommunicationType.NUDGE:
-            probabilities[ResponseType.IGNORE] = 0.4 + (workload_sensitivity * 0.3)
-            probabilities[ResponseType.TAKE_ACTION] = 0.3 + (authority_response * 0.2)
-            probabilities[ResponseType.SEEK_CLARIFICATION] = 0.3
+        if communication_type == CommunicationType.ORDER:
+            weights[TAKE_ACTION_INDEX] = 0.7 + (authority_response * 0.25)
+            weights[SEEK_CLARIFICATION_INDEX] = 0.2 - (authority_response * 0.1)
+            weights[IGNORE_INDEX] = 0.1 - (authority_response * 0.05)
+        elif communication_type == CommunicationType.NUDGE:
+            weights[IGNORE_INDEX] = 0.4 + (workload_sensitivity * 0.3)
+            weights[TAKE_ACTION_INDEX] = 0.3 + (authority_response * 0.2)
+            weights[SEEK_CLARIFICATION_INDEX] = 0.3
         else:  # RECOMMENDATION
-            probabilities[ResponseType.TAKE_ACTION] = 0.5 + (authority_response * 0.2)
-            probabilities[ResponseType.SEEK_CLARIFICATION] = 0.3
-            probabilities[ResponseType.IGNORE] = 0.2 + (workload_sensitivity * 0.2)
+            weights[TAKE_ACTION_INDEX] = 0.5 + (authority_response * 0.2)
+            weights[SEEK_CLARIFICATION_INDEX] = 0.3
+            weights[IGNORE_INDEX] = 0.2 + (workload_sensitivity * 0.2)
+        
+        return weights
+    
+    def calculate_response_probability(self, communication: 'StrategicCommunication') -> Dict[ResponseType, float]:
+        """Calculate probability of different response types based on personality and context."""
+        weights = self.calculate_response_weights(communication)
         
-        # Normalize probabilities
-        total = sum(probabilities.values())
-        return {k: v / total for k, v in probabilities.items()}
+        # Normalize probabilities, leaving out response types with no weight
+        total = sum(weights)
+        return {
+            response_type: weight / total
+            for response_type, weight in zip(RESPONSE_TYPES, weights)
+            if weight
+        }
 
 
 @dataclass
@@ -163,6 +392,7 @@ class StrategicCommunication:
     subject: str = ""
     content: str = ""
     priority: StrategicPriority = StrategicPriority.MEDIUM
+    priority_level: int = 3  # 1 (low) to 5 (critical), used by behavior engines
     deadline: Optional[datetime] = None
     created_at: datetime = field(default_factory=datetime.now)
     organization_id: str = ""
@@ -189,6 +419,9 @@ class AgentResponse:
     action_taken: bool = False
     estimated_completion_time: Optional[datetime] = None
     actual_completion_time: Optional[datetime] = None
+    
+    # Extra details from the generating engine (e.g. AI reasoning)
+    metadata: Dict[str, Any] = field(default_factory=dict)
 
 
 @dataclass
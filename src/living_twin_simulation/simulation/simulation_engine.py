@@ -21,6 +21,7 @@ from ..domain.models import (
     ResponseType,
     PersonalityTrait,
     AgentState,
+    RESPONSE_TYPE_VALUES,
 )
 from ..agents.agent_factory import AgentFactory
 from ..agents.behavior_engine import BehaviorEngine
@@ -50,6 +51,11 @@ class SimulationEngine:
         # Event callbacks
         self.event_callbacks: List[Callable[[SimulationEvent], None]] = []
         
+        # Communications scheduled for response processing but not yet processed
+        self._pending_communications = 0
+        self._communications_drained = asyncio.Event()
+        self._communications_drained.set()
+        
         # Setup time callbacks
         self.time_engine.add_tick_callback(self._on_time_tick)
         
@@ -127,6 +133,7 @@ class SimulationEngine:
         self.state.total_communications_sent += 1
         
         # Schedule response processing
+        self._add_pending_communication()
         self.scheduler.schedule_delay(
             delay_seconds=random.uniform(300, 3600),  # 5 minutes to 1 hour
             callback=lambda: asyncio.create_task(self._process_communication_responses(communication))
@@ -185,33 +192,61 @@ class SimulationEngine:
         
         return consultation
     
+    async def wait_for_pending_communications(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every sent communication has had its responses processed.
+        
+        Returns True once the queue has drained, or False if the timeout expired first.
+        """
+        try:
+            await asyncio.wait_for(self._communications_drained.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+    
+    def _add_pending_communication(self) -> None:
+        """Record a communication awaiting response processing."""
+        self._pending_communications += 1
+        self._communications_drained.clear()
+    
+    def _complete_pending_communication(self) -> None:
+        """Record that a pending communication has been processed."""
+        self._pending_communications -= 1
+        if self._pending_communications < 0:
+            # A double completion is a bug; surface it rather than let the count drift
+            logger.error("Pending communication count went negative; a communication completed twice")
+            self._pending_communications = 0
+        if self._pending_communications == 0:
+            self._communications_drained.set()
+    
     async def _process_communication_responses(self, communication: PriorityCommunication) -> None:
         """Process agent responses to a communication."""
+        try:
+            await self._collect_communication_responses(communication)
+        finally:
+            self._complete_pending_communication()
+    
+    async def _collect_communication_responses(self, communication: PriorityCommunication) -> None:
+        """Collect agent responses to a communication and trigger escalations."""
         
-        responses = []
+        agents = self.state.agents
+        recipients = [agents[recipient_id] for recipient_id in communication.recipient_ids if recipient_id in agents]
         
-        for recipient_id in communication.recipient_ids:
-            agent = self.state.agents.get(recipient_id)
-            if not agent:
-                continue
-            
-            # Generate response using behavior engine
-            response = self.behavior_engine.process_communication(
-                agent, communication, self.state.agents
-            )
-            
-            if response:
-                responses.append(response)
-                communication.responses.append(response)
-                self.state.total_responses_received += 1
-                
-                # Log response event
-                await self._log_event("agent_response", {
-                    "communication_id": communication.id,
-                    "agent_id": agent.id,
-                    "response_type": response.response_type.value,
-                    "sentiment": response.sentiment,
-                }, agent_id=agent.id)
+        # Generate all responses using behavior engine
+        responses = self.behavior_engine.process_communications_batch(
+            recipients, communication, agents
+        )
+        communication.responses.extend(responses)
+        self.state.total_responses_received += len(responses)
+        
+        for response in responses:
+            # Log response event
+            await self._log_event("agent_response", {
+                "communication_id": communication.id,
+                "agent_id": response.agent_id,
+                "response_type": RESPONSE_TYPE_VALUES[response.response_type],
+                "sentiment": response.sentiment,
+            }, agent_id=response.agent_id)
         
         # Check for escalation opportunities
         if communication.type in [CommunicationType.NUDGE, CommunicationType.RECOMMENDATION]:
@@ -224,6 +259,7 @@ class SimulationEngine:
                 self.state.escalations_triggered += 1
                 
                 # Schedule processing for escalated communication
+                self._add_pending_communication()
                 self.scheduler.schedule_delay(
                     delay_seconds=random.uniform(600, 1800),  # 10-30 minutes
                     callback=lambda: asyncio.create_task(self._process_communication_responses(escalated_comm))
@@ -36,3 +36,96 @@ async def test_simulation_engine_creation():
 def test_basic_math():
     """A simple test to verify pytest is working."""
     assert 2 + 2 == 4
+
+
+@pytest.mark.asyncio
+async def test_wait_for_pending_communications():
+    """Test that waiting returns once scheduled communications are processed."""
+    # Fast enough that the longest response delay (one simulated hour) passes within a tick
+    engine = SimulationEngine("test_org", time_acceleration_factor=360000)
+    assert await engine.wait_for_pending_communications(timeout=0.1)
+
+    await engine.start_simulation({
+        "ceo@company.com": {"department": "Executive", "role": "CEO"},
+        "vp.sales@company.com": {"department": "Sales", "role": "VP Sales"},
+    })
+    agent_ids = list(engine.state.agents.keys())
+    await engine.send_communication(
+        sender_id=agent_ids[0],
+        recipient_ids=agent_ids[1:],
+        communication_type=CommunicationType.NUDGE,
+        subject="Test",
+        content="Test communication",
+    )
+    assert not await engine.wait_for_pending_communications(timeout=0.01)
+
+    assert await engine.wait_for_pending_communications(timeout=5)
+    await engine.stop_simulation()
+
+
+def test_expertise_areas_do_not_leak_between_agents():
+    """Test that role-specific expertise is not appended to the shared department defaults."""
+    from living_twin_simulation.agents.agent_factory import AgentFactory
+
+    engineering_defaults = list(AgentFactory.DEPARTMENT_EXPERTISE["Engineering"])
+    manager = AgentFactory.create_agent_from_employee(
+        {
+            "email": "manager@company.com",
+            "department": "Engineering",
+            "role": "Engineering Manager",
+        },
+        "test_org",
+    )
+    engineer = AgentFactory.create_agent_from_employee(
+        {"email": "engineer@company.com", "department": "Engineering", "role": "Engineer"},
+        "test_org",
+    )
+
+    assert "team_management" in manager.professional.expertise_areas
+    assert list(engineer.professional.expertise_areas) == engineering_defaults
+    assert list(AgentFactory.DEPARTMENT_EXPERTISE["Engineering"]) == engineering_defaults
+
+
+def test_relationship_scores_mapping():
+    """Test that the array-backed relationship scores behave like a dict."""
+    from living_twin_simulation.domain.models import RelationshipScores
+
+    scores = RelationshipScores({"a": 0, "b": 1, "c": 2})
+    scores["a"] = 0.7
+    scores["outside"] = 0.2
+
+    assert dict(scores) == {"a": 0.7, "outside": 0.2}
+    assert scores.get("b", 0.5) == 0.5
+    assert len(scores) == 2
+
+    del scores["a"]
+    assert "a" not in scores
+
+
+def test_interaction_history_keeps_most_recent_entries():
+    """Test that the interaction history ring drops the oldest entries once full."""
+    from living_twin_simulation.domain.models import InteractionHistory, ResponseType
+
+    history = InteractionHistory(capacity=3)
+    for i in range(5):
+        history.record(f"comm-{i}", "sender", ResponseType.TAKE_ACTION, i / 10)
+    history.append({
+        "timestamp": "2024-01-01T09:00:00",
+        "communication_id": "comm-5",
+        "sender_id": "sender",
+        "response_type": "ignore",
+        "sentiment": 0.0,
+        "ai_generated": True,
+    })
+
+    assert len(history) == 3
+    assert [entry["communication_id"] for entry in history] == ["comm-3", "comm-4", "comm-5"]
+    assert history[-1] == {
+        "timestamp": "2024-01-01T09:00:00",
+        "communication_id": "comm-5",
+        "sender_id": "sender",
+        "response_type": "ignore",
+        "sentiment": 0.0,
+        "ai_generated": True,
+    }
+    assert history[-2:][0]["response_type"] == "take_action"